@@ -1,55 +1,164 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import re
+import stat
 import subprocess
+import tarfile
+import tempfile
+import threading
+import zipfile
+from array import array
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urlencode
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, make_response, request
 
 from app.jobs import JobCancelled, register_job_handler
 from shutil import which
 from tqdm import tqdm
 
+try:  # Optional dependency for faster JSON encoding of large listings
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - orjson may be unavailable.
+    orjson = None  # type: ignore
+
 archive_manager_bp = Blueprint("archive_manager_app", __name__)
 
 HOME_DIR = Path(os.path.expanduser("~")).resolve()
 DEFAULT_TIMEOUT = 120
-ARCHIVE_EXTENSIONS = {
+STREAM_BUFFER_SIZE = 1024 * 1024
+OUTPUT_TAIL_LIMIT = 2000
+MAX_ARCHIVE_SESSIONS = 8
+MAX_SCOPES_PER_SESSION = 16
+# Keys ETag digests so they never expose the inputs (e.g. archive passwords)
+_ETAG_KEY = os.urandom(16)
+# Single-dot suffixes are matched with one set lookup; only the compound
+# tar suffixes need an endswith() check (a single call, since it takes a tuple).
+_SIMPLE_ARCHIVE_SUFFIXES = frozenset({
     ".7z",
     ".zip",
     ".tar",
-    ".tar.gz",
     ".tgz",
-    ".tar.bz2",
     ".tbz2",
-    ".tar.xz",
     ".txz",
     ".rar",
-}
+})
+_COMPOUND_ARCHIVE_SUFFIXES = (".tar.gz", ".tar.bz2", ".tar.xz")
 
 SEVEN_Z_CANDIDATES = ("7zz", "7z", "7za", "7zr")
+# Archives the extract routes may unpack in-process (see _extract_inprocess)
+_INPROCESS_ZIP_METHODS = frozenset({zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2, zipfile.ZIP_LZMA})
+_INPROCESS_TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+# Non-solid formats whose entries job_extract_archive may split across 7zz processes
+_PARALLEL_EXTRACT_SUFFIXES = frozenset({".zip", ".jar"})
+# (path segments, explicit folder flag, size, packed size, ISO modified) per archive entry
+ArchiveEntry = Tuple[Tuple[str, ...], bool, Optional[int], Optional[int], Optional[str]]
 _PERCENT_RE = re.compile(r"(\d+)%")
+# `7zz -slt` keys the listing code reads, mapped to the str keys stored per record
+_SLT_FIELDS = {
+    b"Path": "Path",
+    b"Folder": "Folder",
+    b"Size": "Size",
+    b"Packed Size": "Packed Size",
+    b"Modified": "Modified",
+}
+# 7-Zip wildcard characters; folders containing them cannot be used in -i! filters
+_7ZZ_WILDCARD_CHARS = frozenset("*?")
+_SLT_FIELD_RE = re.compile(rb"[ \t]*(Path|Folder|Size|Packed Size|Modified) = [ \t]*(.*)")
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+@dataclass
+class DirectoryEntry:
+    __slots__ = ("id", "name", "type", "path", "size", "modified", "is_archive")
+
+    id: str
+    name: str
+    type: str
+    path: str
+    size: Optional[int]
+    modified: Optional[str]
+    is_archive: bool
+
+
+@dataclass
+class ArchiveChild:
+    __slots__ = ("id", "name", "type", "path", "internal", "size", "packed_size", "modified")
+
+    id: str
+    name: str
+    type: str
+    path: str
+    internal: str
+    size: Optional[int]
+    packed_size: Optional[int]
+    modified: Optional[str]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (DirectoryEntry, ArchiveChild)):
+        return {slot: getattr(value, slot) for slot in value.__slots__}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_response(body: Dict[str, Any]) -> Response:
+    # orjson encodes the slotted entry dataclasses natively
+    if orjson is not None:
+        data = orjson.dumps(body, default=_json_default)
+    else:
+        data = json.dumps(body, default=_json_default)
+    return Response(data, mimetype="application/json")
+
+
 def _json_ok(data: Any, status: int = 200):
-    return jsonify({"ok": True, "data": data}), status
+    return _json_response({"ok": True, "data": data}), status
 
 
 def _json_err(message: str, status: int = 400):
-    return jsonify({"ok": False, "error": str(message)}), status
+    return _json_response({"ok": False, "error": str(message)}), status
+
+
+def _archive_etag(path: Path, st: os.stat_result, *extra: Any) -> str:
+    """Strong validator for a response derived only from an archive's contents and ``extra``."""
+    material = "\0".join(str(part) for part in (path, st.st_mtime_ns, st.st_size, *extra))
+    return hashlib.blake2b(
+        material.encode("utf-8", "surrogateescape"), digest_size=16, key=_ETAG_KEY
+    ).hexdigest()
+
+
+def _not_modified(etag: str):
+    response = make_response("", 304)
+    response.set_etag(etag)
+    return response
+
+
+def _json_ok_etag(data: Any, etag: str):
+    response, status = _json_ok(data)
+    response.set_etag(etag)
+    return response, status
+
+
+def _is_archive_name(lower_name: str) -> bool:
+    """Archive check for an already-lowercased file name."""
+    return (
+        lower_name[lower_name.rfind('.'):] in _SIMPLE_ARCHIVE_SUFFIXES
+        or lower_name.endswith(_COMPOUND_ARCHIVE_SUFFIXES)
+    )
 
 
 def _looks_like_archive(path: Path) -> bool:
-    lower = path.name.lower()
-    return any(lower.endswith(ext) for ext in ARCHIVE_EXTENSIONS)
+    return _is_archive_name(path.name.lower())
 
 
 def _select_7zz() -> str:
@@ -78,15 +187,21 @@ def _resolve_user_path(raw: Optional[str], *, must_exist: bool = True) -> Path:
         resolved = candidate.resolve(strict=False)
     except Exception:
         resolved = candidate.absolute()
-    if not str(resolved).startswith(str(HOME_DIR)):
-        raise PermissionError(f"Access denied: {raw}")
+    # Segment-wise containment check; a plain string prefix test would also
+    # accept siblings such as "/home/userfoo" for a home of "/home/user".
+    try:
+        resolved.relative_to(HOME_DIR)
+    except ValueError:
+        raise PermissionError(f"Access denied: {raw}") from None
     if must_exist and not resolved.exists():
         raise FileNotFoundError(f"Path not found: {resolved}")
     return resolved
 
 
-def _list_directory_entries(path: Path, show_hidden: bool) -> List[Dict[str, Any]]:
-    entries: List[Dict[str, Any]] = []
+def _list_directory_entries(path: Path, show_hidden: bool) -> List[DirectoryEntry]:
+    # (rank, lowercased name, scan order, item): sorts on plain tuples without a
+    # key function; scan order breaks ties so the entries are never compared.
+    decorated: List[Tuple[int, str, int, DirectoryEntry]] = []
     try:
         iterator = os.scandir(path)
     except PermissionError as exc:
@@ -99,147 +214,347 @@ def _list_directory_entries(path: Path, show_hidden: bool) -> List[Dict[str, Any
             name = entry.name
             if not show_hidden and name.startswith('.'):
                 continue
-            entry_path = Path(entry.path)
+            lower_name = name.lower()
+            entry_path = entry.path
             try:
-                stat = entry.stat(follow_symlinks=False)
+                st = entry.stat(follow_symlinks=False)
             except Exception:
-                stat = None
-            is_dir = entry.is_dir(follow_symlinks=False)
-            item = {
-                "id": str(entry_path),
-                "name": name,
-                "type": "directory" if is_dir else "file",
-                "path": str(entry_path),
-                "size": None if (stat is None or is_dir) else stat.st_size,
-                "modified": _format_timestamp(stat.st_mtime) if stat else None,
-                "is_archive": (not is_dir) and _looks_like_archive(entry_path),
-            }
-            entries.append(item)
-    entries.sort(key=lambda item: (item["type"] != "directory", item["name"].lower()))
-    return entries
-
-
-def _parse_7zz_slt(output: str) -> List[Dict[str, str]]:
-    records: List[Dict[str, str]] = []
+                st = None
+            # Derive the type from the lstat we already have rather than a second probe
+            is_dir = stat.S_ISDIR(st.st_mode) if st else entry.is_dir(follow_symlinks=False)
+            item = DirectoryEntry(
+                entry_path,
+                name,
+                "directory" if is_dir else "file",
+                entry_path,
+                None if (st is None or is_dir) else st.st_size,
+                _format_timestamp(st.st_mtime) if st else None,
+                (not is_dir) and _is_archive_name(lower_name),
+            )
+            decorated.append((0 if is_dir else 1, lower_name, len(decorated), item))
+    decorated.sort()
+    return [item for _, _, _, item in decorated]
+
+
+def _parse_7zz_slt_stream(lines: Iterable[bytes]) -> Iterator[Dict[str, str]]:
+    """Yield `7zz l -slt` records as soon as each one is complete.
+
+    Lines are raw bytes from 7zz; only the fields in ``_SLT_FIELDS`` are
+    matched and decoded; every other key (CRC, Attributes, Method, ...) is
+    rejected by ``_SLT_FIELD_RE`` without any Python-level work.
+    """
     current: Dict[str, str] = {}
     seen_path = False
 
-    for raw_line in output.splitlines():
-        line = raw_line.strip()
-        if not line:
+    match_field = _SLT_FIELD_RE.match
+    for raw_line in lines:
+        if not raw_line or raw_line.isspace():
             if current:
-                records.append(current)
+                yield current
                 current = {}
                 seen_path = False
             continue
-        if line.startswith("EVENT"):
-            # Skip progress events printed when -bb or similar is enabled
+        # A single regex match both filters to the wanted keys and splits the value
+        match = match_field(raw_line)
+        if match is None:
+            # Skip bare lines, unused keys and progress events printed with -bb
             continue
-        if line.startswith("Path = "):
+        key, value = match.group(1, 2)
+        field = _SLT_FIELDS[key]
+        if field == "Path":
             if current and seen_path:
-                records.append(current)
+                yield current
                 current = {}
             seen_path = True
-        if " = " in line:
-            key, value = line.split(" = ", 1)
-            current[key.strip()] = value.strip()
+        current[field] = value.rstrip().decode("utf-8", "replace")
     if current:
-        records.append(current)
-    return records
+        yield current
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
 
 
-def _list_archive_children(records: Iterable[Dict[str, str]], internal: str, show_hidden: bool,
-                            archive_path: Path) -> List[Dict[str, Any]]:
-    internal_parts = [p for p in internal.split('/') if p]
-    children: Dict[str, Dict[str, Any]] = {}
+def _archive_entries(records: Iterable[Dict[str, str]], archive_name: str) -> Iterator[ArchiveEntry]:
+    """Normalize parsed slt records into compact `ArchiveEntry` tuples.
 
+    Path splitting, folder detection and number parsing happen once here
+    instead of on every folder navigation.
+    """
     for record in records:
         entry_path = record.get("Path", "").strip()
         if not entry_path:
             continue
-        if entry_path == archive_path.name and "Folder" not in record and "Size" not in record:
+        if entry_path == archive_name and "Folder" not in record and "Size" not in record:
             # Skip the archive summary record
             continue
         normalized = entry_path.replace('\\', '/').strip('/')
-        parts = [p for p in normalized.split('/') if p]
-        if internal_parts:
-            if parts[:len(internal_parts)] != internal_parts:
-                continue
-            relative_parts = parts[len(internal_parts):]
-        else:
-            relative_parts = parts
-        if not relative_parts:
+        parts = tuple(p for p in normalized.split('/') if p)
+        if not parts:
+            continue
+        is_folder = record.get("Folder", "").strip().lower() in {"+", "yes", "true", "1"}
+        modified = record.get("Modified")
+        yield (
+            parts,
+            is_folder,
+            _parse_int(record.get("Size")),
+            _parse_int(record.get("Packed Size")),
+            modified.replace(' ', 'T') if modified else None,
+        )
+
+
+def _list_archive_children(entries: Iterable[ArchiveEntry], internal: str, show_hidden: bool,
+                            archive_path: Path) -> List[ArchiveChild]:
+    internal_parts = tuple(p for p in internal.split('/') if p)
+    depth = len(internal_parts)
+
+    # Children are aggregated into parallel arrays (slot per name); response
+    # objects are only materialized once, in sorted order.
+    slot_by_name: Dict[str, int] = {}
+    names: List[str] = []
+    types = bytearray()  # 0 = directory, 1 = file
+    sizes = array('q')  # -1 = unknown
+    packed_sizes = array('q')
+    modified_values: List[Optional[str]] = []
+
+    for parts, is_dir_flag, size, packed_size, modified in entries:
+        if depth and parts[:depth] != internal_parts:
+            continue
+        if len(parts) == depth:
             # This is the directory represented by `internal`; ignore
             continue
-        top_segment = relative_parts[0]
+        top_segment = parts[depth]
         if not show_hidden and top_segment.startswith('.'):
             continue
-        is_dir_flag = record.get("Folder", "").strip().lower() in {"+", "yes", "true", "1"}
         # If there are deeper elements beneath the first segment, treat as directory
-        is_directory = is_dir_flag or len(relative_parts) > 1
-        relative_internal = '/'.join((*internal_parts, top_segment))
-        child = children.get(top_segment)
-        if child is None:
-            child = {
-                "id": f"{archive_path}::{relative_internal}",
-                "name": top_segment,
-                "type": "directory" if is_directory else "file",
-                "path": str(archive_path),
-                "internal": relative_internal,
-                "size": None,
-                "packed_size": None,
-                "modified": None,
-            }
-            children[top_segment] = child
-        if is_directory and child["type"] != "directory":
-            child["type"] = "directory"
-            child["size"] = None
-            child["packed_size"] = None
-        if child["type"] == "file":
-            size_value = record.get("Size")
-            packed_value = record.get("Packed Size")
-            modified_value = record.get("Modified")
-            try:
-                child["size"] = int(size_value) if size_value else None
-            except ValueError:
-                child["size"] = None
-            try:
-                child["packed_size"] = int(packed_value) if packed_value else None
-            except ValueError:
-                child["packed_size"] = None
-            if modified_value:
-                child["modified"] = modified_value.replace(' ', 'T')
-        else:
+        is_directory = is_dir_flag or len(parts) > depth + 1
+        slot = slot_by_name.get(top_segment)
+        if slot is None:
+            slot = len(names)
+            slot_by_name[top_segment] = slot
+            names.append(top_segment)
+            types.append(0 if is_directory else 1)
+            sizes.append(-1)
+            packed_sizes.append(-1)
+            modified_values.append(None)
+        elif is_directory and types[slot]:
+            types[slot] = 0
+            sizes[slot] = -1
+            packed_sizes[slot] = -1
+        if types[slot]:
+            sizes[slot] = -1 if size is None else size
+            packed_sizes[slot] = -1 if packed_size is None else packed_size
+            if modified:
+                modified_values[slot] = modified
+        elif modified and not modified_values[slot]:
             # For directories, prefer an explicit Modified timestamp if 7zz provides one
-            modified_value = record.get("Modified")
-            if modified_value and not child.get("modified"):
-                child["modified"] = modified_value.replace(' ', 'T')
-    results = list(children.values())
-    results.sort(key=lambda item: (item["type"] != "directory", item["name"].lower()))
+            modified_values[slot] = modified
+
+    order = sorted(range(len(names)), key=lambda i: (types[i], names[i].lower()))
+    archive_str = str(archive_path)
+    prefix = '/'.join(internal_parts)
+    results: List[ArchiveChild] = []
+    for i in order:
+        name = names[i]
+        relative_internal = f"{prefix}/{name}" if prefix else name
+        results.append(ArchiveChild(
+            f"{archive_str}::{relative_internal}",
+            name,
+            "file" if types[i] else "directory",
+            archive_str,
+            relative_internal,
+            sizes[i] if sizes[i] >= 0 else None,
+            packed_sizes[i] if packed_sizes[i] >= 0 else None,
+            modified_values[i],
+        ))
     return results
 
 
-def _run_7zz(args: Iterable[str], *, cwd: Optional[Path] = None) -> subprocess.CompletedProcess[str]:
-    seven = _select_7zz()
-    cmd = [seven, *args]
+def _stream_7zz(cmd: List[str], cwd: Optional[Path]) -> Tuple[subprocess.Popen, Iterator[bytes]]:
+    # stderr goes to a file, not a pipe: nothing drains it while stdout is
+    # being read, so a damaged archive's warnings could fill a pipe and stall
+    # 7zz until the watchdog kills it
+    err = tempfile.TemporaryFile()
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=err,
+            bufsize=STREAM_BUFFER_SIZE,
             cwd=str(cwd) if cwd else None,
-            timeout=DEFAULT_TIMEOUT,
         )
     except FileNotFoundError as exc:
+        err.close()
         raise RuntimeError("7zz executable not found. Install the p7zip package on Termux.") from exc
-    except subprocess.TimeoutExpired as exc:
-        raise RuntimeError("7zz command timed out.") from exc
+    except BaseException:
+        err.close()
+        raise
+
+    def _lines() -> Iterator[bytes]:
+        timed_out = threading.Event()
+
+        def _expire() -> None:
+            timed_out.set()
+            proc.kill()
+
+        # Reading stdout blocks, so enforce DEFAULT_TIMEOUT with a watchdog instead
+        watchdog = threading.Timer(DEFAULT_TIMEOUT, _expire)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            yield from proc.stdout
+            try:
+                proc.wait(timeout=DEFAULT_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                timed_out.set()
+            if timed_out.is_set():
+                raise RuntimeError("7zz command timed out.")
+            if proc.returncode != 0:
+                stderr = _read_tail(err).strip()
+                raise RuntimeError(stderr or f"7zz exited with code {proc.returncode}")
+        finally:
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            if proc.stdout:
+                proc.stdout.close()
+            err.close()
+
+    return proc, _lines()
+
+
+def _read_tail(handle, limit: int = OUTPUT_TAIL_LIMIT) -> str:
+    """Decode at most the last ``limit`` bytes written to a captured output file."""
+    size = handle.seek(0, os.SEEK_END)
+    handle.seek(max(0, size - limit))
+    text = handle.read().decode("utf-8", "replace")
+    return text if size <= limit else f"…{text}"
+
+
+def _run_7zz(args: Iterable[str], *, cwd: Optional[Path] = None, stream: bool = False):
+    """Run 7zz and return the completed process.
+
+    stdout/stderr are captured in temporary files rather than pipes, so a
+    noisy run never holds its full output in memory; only the last
+    ``OUTPUT_TAIL_LIMIT`` bytes of each are returned.
+
+    With ``stream=True`` the process is left running and ``(proc, stdout_iter)``
+    is returned instead; iterating the lines raises ``RuntimeError`` on failure.
+    """
+    seven = _select_7zz()
+    cmd = [seven, *args]
+    if stream:
+        return _stream_7zz(cmd, cwd)
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        try:
+            proc = subprocess.Popen(cmd, stdout=out, stderr=err, cwd=str(cwd) if cwd else None)
+        except FileNotFoundError as exc:
+            raise RuntimeError("7zz executable not found. Install the p7zip package on Termux.") from exc
+        try:
+            returncode = proc.wait(timeout=DEFAULT_TIMEOUT)
+        except subprocess.TimeoutExpired as exc:
+            proc.kill()
+            proc.wait()
+            raise RuntimeError("7zz command timed out.") from exc
+        result = subprocess.CompletedProcess(cmd, returncode, _read_tail(out), _read_tail(err))
     if result.returncode != 0:
         message = result.stderr.strip() or result.stdout.strip() or f"7zz exited with code {result.returncode}"
         raise RuntimeError(message)
     return result
 
 
+def _validate_internal(internal: str) -> str:
+    """Normalize an archive-internal folder path, rejecting parent traversal."""
+    parts = [part for part in internal.replace('\\', '/').split('/') if part]
+    if any(part in {'.', '..'} for part in parts):
+        raise ValueError(f"Invalid archive path: {internal}")
+    return '/'.join(parts)
+
+
+def _listing_scope(internal: str) -> str:
+    """Folder 7zz may restrict its listing to, or "" for a full listing.
+
+    Folder names containing 7-Zip wildcard characters cannot be expressed
+    as include filters, so those fall back to listing the whole archive.
+    """
+    if not internal or any(ch in internal for ch in _7ZZ_WILDCARD_CHARS):
+        return ""
+    return internal
+
+
+def _list_archive_entries(path: Path, scope: str = "") -> Tuple[ArchiveEntry, ...]:
+    """List an archive with 7zz as `ArchiveEntry` tuples.
+
+    A non-empty ``scope`` (see `_listing_scope`) passes include filters so
+    7zz only lists that folder's subtree. The 7zz output is parsed and
+    normalized in one streaming pass; no per-record dicts are retained.
+    """
+    args = ["l", "-slt", "-ba"]
+    if scope:
+        # Arguments go straight to argv (no shell), so no quoting is needed
+        args.extend((f"-i!{scope}", f"-ir!{scope}/*"))
+    args.append(str(path))
+    _, lines = _run_7zz(args, stream=True)
+    return tuple(_archive_entries(_parse_7zz_slt_stream(lines), path.name))
+
+
+class _ArchiveSession:
+    """Listings of one version of an archive, shared across browse requests.
+
+    A full listing answers every folder; otherwise scoped listings are kept
+    per folder and also answer any folder nested inside them.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._listings: Dict[str, Tuple[ArchiveEntry, ...]] = {}
+
+    def _entries_for(self, internal: str) -> Tuple[ArchiveEntry, ...]:
+        # Held while 7zz runs so concurrent requests for one archive list it once
+        with self._lock:
+            for scope, entries in self._listings.items():
+                if not scope or internal == scope or internal.startswith(f"{scope}/"):
+                    return entries
+            scope = _listing_scope(internal)
+            entries = _list_archive_entries(self.path, scope)
+            self._listings[scope] = entries
+            while len(self._listings) > MAX_SCOPES_PER_SESSION:
+                self._listings.pop(next(iter(self._listings)))
+            return entries
+
+    def children(self, internal: str, show_hidden: bool) -> List[ArchiveChild]:
+        return _list_archive_children(self._entries_for(internal), internal, show_hidden, self.path)
+
+
+_SESSIONS: "OrderedDict[Tuple[str, int, int], _ArchiveSession]" = OrderedDict()
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_session(path: Path, st: os.stat_result) -> _ArchiveSession:
+    """Session for the archive's current version; rewritten archives get a new one."""
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is not None:
+            _SESSIONS.move_to_end(key)
+            return session
+        for stale in [k for k in _SESSIONS if k[0] == key[0]]:
+            del _SESSIONS[stale]
+        session = _ArchiveSession(path)
+        _SESSIONS[key] = session
+        while len(_SESSIONS) > MAX_ARCHIVE_SESSIONS:
+            _SESSIONS.popitem(last=False)
+        return session
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -252,9 +567,12 @@ def ping():
 @archive_manager_bp.route("/browse", methods=["GET"])
 def browse():
     raw_path = request.args.get("path", "~")
-    internal = (request.args.get("internal", "") or "").strip('/')
     show_hidden = request.args.get("hidden", "false").lower() in {"1", "true", "yes", "on"}
     forced_archive = request.args.get("archive", "false").lower() in {"1", "true", "yes", "on"}
+    try:
+        internal = _validate_internal(request.args.get("internal", "") or "")
+    except ValueError as exc:
+        return _json_err(str(exc), 400)
 
     try:
         target_path = _resolve_user_path(raw_path, must_exist=True)
@@ -286,12 +604,18 @@ def browse():
         return _json_err("Unsupported archive type.", 400)
 
     try:
-        result = _run_7zz(["l", "-slt", "-ba", str(target_path)])
+        st = os.stat(target_path)
+    except OSError as exc:
+        return _json_err(str(exc), 404)
+
+    etag = _archive_etag(target_path, st, internal, show_hidden)
+    if request.if_none_match.contains(etag):
+        return _not_modified(etag)
+
+    try:
+        entries = _get_session(target_path, st).children(internal, show_hidden)
     except RuntimeError as exc:
         return _json_err(str(exc), 500)
-
-    records = _parse_7zz_slt(result.stdout)
-    entries = _list_archive_children(records, internal, show_hidden, target_path)
     payload = {
         "mode": "archive",
         "archive_path": str(target_path),
@@ -299,7 +623,7 @@ def browse():
         "entries": entries,
         "show_hidden": show_hidden,
     }
-    return _json_ok(payload)
+    return _json_ok_etag(payload, etag)
 
 
 @archive_manager_bp.route("/archives/launch", methods=["POST"])
@@ -352,28 +676,74 @@ def launch_archive():
     })
 
 
-def _build_create_command(archive_path: Path, sources: List[Path], options: Dict[str, Any]) -> List[str]:
-    cmd: List[str] = ["a"]
-    archive_format = options.get("format")
-    if archive_format:
-        archive_format = str(archive_format).strip()
-        if archive_format:
-            cmd.append(f"-t{archive_format}")
-    compression_level = options.get("compression_level")
-    if compression_level is not None:
+def _format_flag(value: Any, options: Dict[str, Any]) -> Optional[str]:
+    archive_format = str(value).strip() if value else ""
+    return f"-t{archive_format}" if archive_format else None
+
+
+def _compression_level_flag(value: Any, options: Dict[str, Any]) -> Optional[str]:
+    if value is None:
+        return None
+    return f"-mx={max(0, min(int(value), 9))}"
+
+
+def _solid_flag(value: Any, options: Dict[str, Any]) -> Optional[str]:
+    return "-ms=off" if value is False else None
+
+
+def _threads_flag(value: Any, options: Dict[str, Any]) -> Optional[str]:
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return f"-mmt={value}"
+    return "-mmt=on"
+
+
+def _password_flag(value: Any, options: Dict[str, Any]) -> Optional[str]:
+    return f"-p{value}" if isinstance(value, str) and value else None
+
+
+def _encrypt_headers_flag(value: Any, options: Dict[str, Any]) -> Optional[str]:
+    return "-mhe=on" if value and _password_flag(options.get("password"), options) else None
+
+
+_OVERWRITE_FLAGS = {"overwrite": "-aoa", "skip": "-aos", "rename": "-aou"}
+
+
+def _overwrite_flag(value: Any, options: Dict[str, Any]) -> Optional[str]:
+    return _OVERWRITE_FLAGS.get(value)
+
+
+OptionEmitter = Callable[[Any, Dict[str, Any]], Optional[str]]
+
+# Option schema for 7zz commands: (options key, emitter) in command-line order
+_CREATE_OPTION_EMITTERS: Tuple[Tuple[str, OptionEmitter], ...] = (
+    ("format", _format_flag),
+    ("compression_level", _compression_level_flag),
+    ("solid", _solid_flag),
+    ("threads", _threads_flag),
+    ("password", _password_flag),
+    ("encrypt_headers", _encrypt_headers_flag),
+)
+_EXTRACT_OPTION_EMITTERS: Tuple[Tuple[str, OptionEmitter], ...] = (
+    ("overwrite", _overwrite_flag),
+    ("password", _password_flag),
+)
+
+
+def _option_flags(emitters: Tuple[Tuple[str, OptionEmitter], ...], options: Dict[str, Any]) -> List[str]:
+    flags: List[str] = []
+    for key, emit in emitters:
         try:
-            level = int(compression_level)
-            level = max(0, min(level, 9))
-            cmd.append(f"-mx={level}")
+            flag = emit(options.get(key), options)
         except (TypeError, ValueError):
-            pass
-    if options.get("solid") is False:
-        cmd.append("-ms=off")
-    password = options.get("password")
-    if isinstance(password, str) and password:
-        cmd.append(f"-p{password}")
-        if options.get("encrypt_headers"):
-            cmd.append("-mhe=on")
+            # Malformed option values are ignored rather than failing the command
+            continue
+        if flag:
+            flags.append(flag)
+    return flags
+
+
+def _build_create_command(archive_path: Path, sources: List[Path], options: Dict[str, Any]) -> List[str]:
+    cmd: List[str] = ["a", *_option_flags(_CREATE_OPTION_EMITTERS, options)]
     cmd.append(str(archive_path))
     cmd.extend(str(path) for path in sources)
     return cmd
@@ -381,6 +751,12 @@ def _build_create_command(archive_path: Path, sources: List[Path], options: Dict
 
 @archive_manager_bp.route("/archives/create", methods=["POST"])
 def create_archive():
+    """Create (or add to) an archive with 7zz.
+
+    Supported ``options``: ``format``, ``compression_level`` (0-9), ``solid``,
+    ``password``, ``encrypt_headers`` and ``threads`` (compression threads;
+    defaults to all cores via ``-mmt=on``).
+    """
     payload = request.get_json(silent=True) or {}
     raw_archive_path = payload.get("archive_path")
     raw_sources = payload.get("sources") or []
@@ -431,17 +807,8 @@ def _build_extract_command(
     destination: Path,
     options: Dict[str, Any],
 ) -> List[str]:
-    cmd: List[str] = ["x", str(archive_path)]
-    overwrite_policy = (options or {}).get("overwrite")
-    if overwrite_policy == "overwrite":
-        cmd.append("-aoa")
-    elif overwrite_policy == "skip":
-        cmd.append("-aos")
-    elif overwrite_policy == "rename":
-        cmd.append("-aou")
-    password = options.get("password")
-    if isinstance(password, str) and password:
-        cmd.append(f"-p{password}")
+    options = options or {}
+    cmd: List[str] = ["x", str(archive_path), *_option_flags(_EXTRACT_OPTION_EMITTERS, options)]
     if items:
         cmd.extend(items)
     cmd.append(f"-o{destination}")
@@ -450,6 +817,72 @@ def _build_extract_command(
     return cmd
 
 
+def _extract_inprocess(
+    archive_path: Path,
+    items: List[str],
+    destination: Path,
+    options: Dict[str, Any],
+) -> Optional[subprocess.CompletedProcess]:
+    """Fully extract plain zip/tar archives with the stdlib instead of spawning 7zz.
+
+    Only used for a full extraction: no item selection, no password, paths
+    preserved and an empty destination (so the overwrite policy never comes
+    into play). Zip unix modes are restored from ``external_attr``; zips with
+    symlink entries and tars the "data" filter would reject are left to 7zz.
+    Returns None when 7zz should be used.
+    """
+    if items or options.get("password") or options.get("preserve_paths") is False:
+        return None
+    try:
+        if any(destination.iterdir()):
+            return None
+    except OSError:
+        return None
+
+    lower = archive_path.name.lower()
+    try:
+        if lower.endswith(".zip"):
+            with zipfile.ZipFile(archive_path) as handle:
+                members = handle.infolist()
+                # Leave encrypted entries and exotic codecs (deflate64, ...) to 7zz
+                if any(info.flag_bits & 0x1 or info.compress_type not in _INPROCESS_ZIP_METHODS
+                       for info in members):
+                    return None
+                # zipfile writes symlink entries as plain files holding the
+                # target; 7zz recreates the link
+                if any(stat.S_ISLNK(info.external_attr >> 16) for info in members):
+                    return None
+                written = [(handle.extract(info, destination), info) for info in members]
+                # zipfile also drops unix permissions; restore them the way 7zz
+                # does, deepest directories last so none can block its contents
+                for path, info in sorted(written, key=lambda pair: (pair[1].is_dir(), -pair[0].count(os.sep))):
+                    mode = (info.external_attr >> 16) & 0o777
+                    if info.create_system == 3 and mode:
+                        os.chmod(path, mode)
+        elif lower.endswith(_INPROCESS_TAR_SUFFIXES) and hasattr(tarfile, "data_filter"):
+            try:
+                handle = tarfile.open(archive_path)
+            except tarfile.TarError:
+                return None
+            with handle:
+                # The data filter rejects absolute or escaping links that 7zz
+                # extracts fine; vet every member first so such archives go
+                # to 7zz instead of failing halfway through
+                try:
+                    for member in handle.getmembers():
+                        tarfile.data_filter(member, str(destination))
+                except tarfile.FilterError:
+                    return None
+                handle.extractall(destination, filter="data")
+        else:
+            return None
+    except zipfile.BadZipFile:
+        return None
+    except (OSError, tarfile.TarError) as exc:
+        raise RuntimeError(f"Failed to extract {archive_path.name}: {exc}") from exc
+    return subprocess.CompletedProcess([], 0, "", "")
+
+
 @archive_manager_bp.route("/archives/extract", methods=["POST"])
 def extract_archive():
     payload = request.get_json(silent=True) or {}
@@ -484,8 +917,10 @@ def extract_archive():
         normalized_items.append(item.strip().lstrip('/'))
 
     try:
-        cmd = _build_extract_command(archive_path, normalized_items, destination, options)
-        result = _run_7zz(cmd, cwd=archive_path.parent)
+        result = _extract_inprocess(archive_path, normalized_items, destination, options)
+        if result is None:
+            cmd = _build_extract_command(archive_path, normalized_items, destination, options)
+            result = _run_7zz(cmd, cwd=archive_path.parent)
     except RuntimeError as exc:
         return _json_err(str(exc), 500)
 
@@ -527,8 +962,10 @@ def expand_archive():
         return _json_err(str(exc), 403)
 
     try:
-        cmd = _build_extract_command(archive_path, [], destination, options)
-        result = _run_7zz(cmd, cwd=archive_path.parent)
+        result = _extract_inprocess(archive_path, [], destination, options)
+        if result is None:
+            cmd = _build_extract_command(archive_path, [], destination, options)
+            result = _run_7zz(cmd, cwd=archive_path.parent)
     except RuntimeError as exc:
         return _json_err(str(exc), 500)
 
@@ -540,6 +977,102 @@ def expand_archive():
     })
 
 
+def _items_are_disjoint(items: List[str]) -> bool:
+    """True when no selected item lies inside another selected item."""
+    ordered = sorted(item.rstrip('/') for item in items)
+    return all(
+        current != previous and not current.startswith(previous + '/')
+        for previous, current in zip(ordered, ordered[1:])
+    )
+
+
+class _ProcessGroup:
+    """Present several worker processes to the job context as one process."""
+
+    def __init__(self) -> None:
+        self._procs: List[subprocess.Popen] = []
+        self._lock = threading.Lock()
+        self._killed = False
+
+    def add(self, proc: subprocess.Popen) -> bool:
+        with self._lock:
+            if self._killed:
+                return False
+            self._procs.append(proc)
+            return True
+
+    def poll(self) -> Optional[int]:
+        with self._lock:
+            return None if not self._killed else 0
+
+    def kill(self) -> None:
+        with self._lock:
+            self._killed = True
+            running = list(self._procs)
+        for proc in running:
+            if proc.poll() is None:
+                proc.kill()
+
+
+def _extract_in_parallel(ctx, archive_path: Path, commands: List[List[str]]) -> None:
+    """Run one 7zz extraction per command concurrently, reporting per-chunk progress.
+
+    Zip-family archives store entries independently, so disjoint item subsets
+    can be decompressed by separate 7zz processes. The workers are attached to
+    the job as one process group, so cancelling the job kills every one of them.
+    """
+    group = _ProcessGroup()
+
+    def _run(cmd: List[str]) -> Tuple[int, str, str]:
+        with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+            proc = subprocess.Popen(cmd, stdout=out, stderr=err, cwd=str(archive_path.parent))
+            if not group.add(proc):
+                proc.kill()
+                proc.wait()
+                return -1, '', ''
+            try:
+                returncode = proc.wait(timeout=DEFAULT_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                return proc.returncode, _read_tail(out), "7zz command timed out."
+            return returncode, _read_tail(out), _read_tail(err)
+
+    total = len(commands)
+    done_count = 0
+    failures: List[Tuple[int, str, str]] = []
+    ctx.attach_process(group)
+    try:
+        with ThreadPoolExecutor(max_workers=total) as executor:
+            pending = {executor.submit(_run, cmd) for cmd in commands}
+            try:
+                while pending:
+                    done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                    ctx.check_cancelled()
+                    for future in done:
+                        returncode, output, errors = future.result()
+                        done_count += 1
+                        if returncode != 0:
+                            failures.append((returncode, output, errors))
+                        percent = done_count * 100 // total
+                        ctx.set_progress(completed=percent, total=100, detail=f"{percent}%")
+                        ctx.set_message(f"Extracting {archive_path.name}: {done_count}/{total} chunks")
+            except JobCancelled:
+                group.kill()
+                raise
+    finally:
+        ctx.detach_process()
+
+    if failures:
+        returncode, output, errors = failures[0]
+        lines = [line.strip() for line in output.splitlines() if line.strip()]
+        summary = errors.strip() or (lines[-1] if lines else '')
+        message = f"Extracting {archive_path.name} finished with an error (exit code {returncode})"
+        if summary:
+            message = f"{message}: {summary}"
+        raise RuntimeError(message)
+
+
 @register_job_handler("extract_archive")
 def job_extract_archive(ctx, params):
     """Background job handler for archive extraction."""
@@ -582,6 +1115,31 @@ def job_extract_archive(ctx, params):
     if append_snld and '-snld' not in base_cmd:
         base_cmd.insert(2, '-snld')
 
+    workers = min(os.cpu_count() or 1, len(normalized_items))
+    if (
+        workers > 1
+        and archive_path.suffix.lower() in _PARALLEL_EXTRACT_SUFFIXES
+        and _items_are_disjoint(normalized_items)
+    ):
+        chunks = [normalized_items[index::workers] for index in range(workers)]
+        commands = []
+        for chunk in chunks:
+            chunk_cmd = _build_extract_command(archive_path, chunk, destination, options)
+            if append_snld and '-snld' not in chunk_cmd:
+                chunk_cmd.insert(2, '-snld')
+            commands.append([seven, *chunk_cmd])
+        _extract_in_parallel(ctx, archive_path, commands)
+        ctx.finish(
+            message=f"Extracted to {destination}",
+            result={
+                "archive_path": str(archive_path),
+                "destination": str(destination),
+                "stdout": '',
+                "stderr": '',
+            },
+        )
+        return
+
     full_cmd = [seven, *base_cmd]
 
     proc = subprocess.Popen(
@@ -723,15 +1281,24 @@ def test_archive():
     if isinstance(password, str) and password:
         cmd.append(f"-p{password}")
 
+    try:
+        st = os.stat(archive_path)
+    except OSError as exc:
+        return _json_err(str(exc), 404)
+    etag = _archive_etag(archive_path, st, "test", password or "")
+    if request.if_none_match.contains(etag):
+        return _not_modified(etag)
+
     try:
         result = _run_7zz(cmd, cwd=archive_path.parent)
     except RuntimeError as exc:
         return _json_err(str(exc), 500)
 
-    return _json_ok(
+    return _json_ok_etag(
         {
             "archive_path": str(archive_path),
             "stdout": result.stdout,
             "stderr": result.stderr,
-        }
+        },
+        etag,
     )
@@ -1,4 +1,5 @@
 const POLL_INTERVAL_MS = 5000;
+const EVENTS_URL = '/api/app/aria_downloader/events';
 const SHELL_LOG_TAIL = 120;
 const HOST_STORE_KEY = '__ariaDownloaderHost';
 
@@ -213,6 +214,7 @@ export default function init(container, api, host) {
     sortDir: 'desc',
     lastDirectory: '~',
     pollTimer: null,
+    eventSource: null,
     lastErrorMessage: null,
     errorToastShown: false,
     loading: true,
@@ -721,6 +723,29 @@ export default function init(container, api, host) {
     }
   }
 
+  // aria2 pushes start/pause/stop/complete notifications; refresh on those
+  // instead of waiting for the next poll tick.
+  function startEvents() {
+    if (state.eventSource || typeof window.EventSource !== 'function') return;
+    try {
+      state.eventSource = new EventSource(EVENTS_URL);
+    } catch (error) {
+      console.warn('aria_downloader events unavailable', error);
+      state.eventSource = null;
+      return;
+    }
+    state.eventSource.onmessage = () => {
+      if (!document.hidden) refreshDownloads({});
+    };
+  }
+
+  function stopEvents() {
+    if (state.eventSource) {
+      state.eventSource.close();
+      state.eventSource = null;
+    }
+  }
+
   async function runControl(action, gids) {
     let targetGids = gids;
     if (!Array.isArray(targetGids) && action !== 'purge' && action !== 'pauseAll' && action !== 'resumeAll') {
@@ -1045,10 +1070,12 @@ export default function init(container, api, host) {
 
   registerBeforeExit(() => {
     stopPolling();
+    stopEvents();
   });
 
   renderShell();
   fullRefresh({ manual: true }).finally(() => {
     startPolling();
+    startEvents();
   });
 }
@@ -2,24 +2,62 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import http.client
+import itertools
 import json
 import os
+import threading
 import time
-import urllib.error
-import urllib.request
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from queue import Empty, Full, Queue
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, request, stream_with_context
 
 from app.framework_shells import FrameworkShellManager
 from app.framework_shells import _manager as get_framework_shell_manager
 
+try:  # Optional dependency for faster RPC payload encoding/decoding
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - orjson may be unavailable.
+    orjson = None  # type: ignore
+
+try:  # Optional dependency for the persistent WebSocket transport
+    import simple_websocket  # type: ignore
+except Exception:  # pragma: no cover - fall back to HTTP JSON-RPC.
+    simple_websocket = None  # type: ignore
+
 aria_downloader_bp = Blueprint('aria_downloader', __name__)
 
 DEFAULT_RPC_URL = 'http://127.0.0.1:6800/jsonrpc'
 MAX_RESULT_ITEMS = 200
 RPC_TIMEOUT_SECONDS = 10
+RPC_POOL_MAXSIZE = 8
+WS_RECONNECT_DELAY_SECONDS = 5
+EVENT_QUEUE_MAXSIZE = 256
+EVENT_KEEPALIVE_SECONDS = 25
+POLL_CACHE_TTL_SECONDS = 0.25
+
+# Fields requested from aria2.tell*; exactly what _simplify_task reads.
+TASK_KEYS = [
+    'gid',
+    'status',
+    'totalLength',
+    'completedLength',
+    'downloadSpeed',
+    'uploadSpeed',
+    'connections',
+    'dir',
+    'errorMessage',
+    'followedBy',
+    'verifiedLength',
+    'bittorrent',
+    'files',
+]
 
 JsonValue = Any
 RpcResult = Tuple[Optional[JsonValue], Optional[str]]
@@ -33,54 +71,343 @@ DEFAULT_ARIA2_COMMAND = [
 DEFAULT_ARIA2_LABEL = 'aria2'
 DEFAULT_SHELL_CWD = '~/services/aria2'
 DEFAULT_LOG_TAIL_LINES = 200
+TRUTHY_ARGS = frozenset({'1', 'true', 'yes'})
 STATE_DIR = Path(os.path.expanduser('~/.cache/aria_downloader'))
 STATE_FILE = STATE_DIR / 'framework_shell.json'
 
 
+@functools.lru_cache(maxsize=1)
 def _rpc_config() -> Tuple[str, Optional[str]]:
-    """Read RPC endpoint configuration from environment."""
+    """Read RPC endpoint configuration from environment.
+
+    Returns ``(url, token_param)`` where ``token_param`` is the ready-made
+    ``token:<secret>`` argument, or None when no secret is configured. The
+    result is cached; call ``_rpc_config.cache_clear()`` after changing the
+    environment.
+    """
     url = os.getenv('ARIA2_RPC_URL', DEFAULT_RPC_URL)
     secret = os.getenv('ARIA2_RPC_SECRET')
-    return url, secret
+    return url, f'token:{secret}' if secret else None
+
+
+# Idle keep-alive connections to aria2, keyed by (scheme, host, port). Reusing
+# them skips the TCP handshake that every urlopen() call used to pay.
+_RPC_IDLE: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+_RPC_POOL_LOCK = threading.Lock()
+
+# Errors that mean a pooled socket was closed by aria2 while idle; the request
+# is retried once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class RpcHTTPError(Exception):
+    """Non-2xx HTTP status returned by the aria2 RPC endpoint."""
+
+    def __init__(self, code: int, reason: str) -> None:
+        super().__init__(f'{code} {reason}')
+        self.code = code
+        self.reason = reason
+
+
+@functools.lru_cache(maxsize=4)
+def _rpc_target(url: str) -> Tuple[Tuple[str, str, int], str]:
+    parsed = urlsplit(url)
+    scheme = 'https' if parsed.scheme.lower() in {'https', 'wss'} else 'http'
+    port = parsed.port or (443 if scheme == 'https' else 80)
+    path = parsed.path or '/'
+    if parsed.query:
+        path = f'{path}?{parsed.query}'
+    return (scheme, parsed.hostname or '127.0.0.1', port), path
+
+
+def _acquire_connection(key: Tuple[str, str, int]) -> Tuple[http.client.HTTPConnection, bool]:
+    with _RPC_POOL_LOCK:
+        idle = _RPC_IDLE.get(key)
+        if idle:
+            return idle.pop(), True
+    scheme, host, port = key
+    conn_cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+    return conn_cls(host, port, timeout=RPC_TIMEOUT_SECONDS), False
+
+
+def _release_connection(key: Tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+    with _RPC_POOL_LOCK:
+        idle = _RPC_IDLE.setdefault(key, [])
+        if len(idle) < RPC_POOL_MAXSIZE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _post_rpc(url: str, payload: bytes) -> bytes:
+    """POST *payload* to aria2 over a pooled keep-alive connection."""
+    key, path = _rpc_target(url)
+    headers = {'Content-Type': 'application/json'}
+    while True:
+        conn, reused = _acquire_connection(key)
+        try:
+            conn.request('POST', path, body=payload, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except _STALE_CONNECTION_ERRORS:
+            conn.close()
+            if reused:
+                continue
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            _release_connection(key, conn)
+        if response.status >= 400:
+            raise RpcHTTPError(response.status, response.reason)
+        return body
 
 
-def call_rpc(method: str, *params: JsonValue) -> RpcResult:
-    """Call aria2 JSON-RPC and return (result, error_message)."""
-    url, secret = _rpc_config()
-    rpc_params: List[JsonValue] = list(params)
-    if secret:
-        rpc_params.insert(0, f'token:{secret}')
-
-    payload = json.dumps({
-        'jsonrpc': '2.0',
-        'id': 'aria_downloader',
-        'method': method,
-        'params': rpc_params,
-    }).encode('utf-8')
-
-    request_obj = urllib.request.Request(
-        url,
-        data=payload,
-        headers={'Content-Type': 'application/json'},
-        method='POST',
-    )
+# ----------------------------------------------------------------------
+# WebSocket transport
+
+
+_WS_SCHEMES = {'http': 'ws', 'https': 'wss', 'ws': 'ws', 'wss': 'wss'}
+
+
+@functools.lru_cache(maxsize=4)
+def _websocket_url(url: str) -> Optional[str]:
+    """Return the aria2 WebSocket endpoint for *url*, or None to use HTTP.
+
+    Cached like _rpc_config(); clear both after changing the environment.
+    """
+    if simple_websocket is None or os.getenv('ARIA2_RPC_TRANSPORT', '').lower() == 'http':
+        return None
+    parsed = urlsplit(url)
+    scheme = _WS_SCHEMES.get(parsed.scheme.lower())
+    if not scheme:
+        return None
+    return urlunsplit(parsed._replace(scheme=scheme))
+
+
+def _daemon_thread(*args: Any, **kwargs: Any) -> threading.Thread:
+    # simple_websocket's reader thread must not keep worker processes alive
+    return threading.Thread(*args, daemon=True, **kwargs)
+
+
+class _PendingReply:
+    __slots__ = ('event', 'expected', 'replies', 'closed')
+
+    def __init__(self, expected: int) -> None:
+        self.event = threading.Event()
+        self.expected = expected
+        self.replies: List[Dict[str, Any]] = []
+        self.closed = False
+
+
+class _Aria2WebSocket:
+    """One shared WebSocket to aria2, multiplexing RPC calls by request id.
+
+    A reader thread routes responses to the waiting callers and forwards
+    aria2.on* notifications to the listener queues behind ``/events``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ws: Any = None
+        self._url: Optional[str] = None
+        self._retry_at = 0.0
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, _PendingReply] = {}
+        self._listeners: List[Queue] = []
+
+    def connect(self, url: str) -> Any:
+        with self._lock:
+            if self._ws is not None and self._url == url:
+                return self._ws
+            if self._ws is not None:
+                stale, self._ws = self._ws, None
+                self._close_quietly(stale)
+            if time.monotonic() < self._retry_at:
+                return None
+            try:
+                ws = simple_websocket.Client.connect(url, thread_class=_daemon_thread)
+            except Exception:
+                self._retry_at = time.monotonic() + WS_RECONNECT_DELAY_SECONDS
+                return None
+            self._ws = ws
+            self._url = url
+        threading.Thread(target=self._read_loop, args=(ws,), name='aria2-ws', daemon=True).start()
+        return ws
+
+    def request(self, url: str, envelope: Any, timeout: float) -> Optional[Any]:
+        """Send *envelope* and wait for its reply.
+
+        Returns None when the socket is unavailable and nothing was sent, so the
+        caller can fall back to HTTP without risking a duplicated call.
+        """
+        ws = self.connect(url)
+        if ws is None:
+            return None
+        batch = isinstance(envelope, list)
+        calls = envelope if batch else [envelope]
+        waiter = _PendingReply(len(calls))
+        original_ids: Dict[int, Any] = {}
+        frames: List[Dict[str, Any]] = []
+        with self._lock:
+            for call in calls:
+                ws_id = next(self._ids)
+                original_ids[ws_id] = call.get('id')
+                self._pending[ws_id] = waiter
+                frames.append({**call, 'id': ws_id})
+        try:
+            try:
+                ws.send(_dumps(frames if batch else frames[0]).decode('utf-8'))
+            except Exception:
+                self._drop(ws)
+                return None
+            if not waiter.event.wait(timeout):
+                raise TimeoutError('timed out waiting for aria2 WebSocket reply')
+            if waiter.closed:
+                raise ConnectionError('aria2 WebSocket connection closed')
+        finally:
+            with self._lock:
+                for ws_id in original_ids:
+                    self._pending.pop(ws_id, None)
+
+        replies = [{**reply, 'id': original_ids.get(reply.get('id'))} for reply in waiter.replies]
+        return replies if batch else replies[0]
+
+    def add_listener(self, queue: Queue) -> None:
+        with self._lock:
+            self._listeners.append(queue)
+
+    def remove_listener(self, queue: Queue) -> None:
+        with self._lock:
+            try:
+                self._listeners.remove(queue)
+            except ValueError:
+                pass
+
+    def _read_loop(self, ws: Any) -> None:
+        try:
+            while True:
+                message = ws.receive()
+                if message is None:
+                    continue
+                try:
+                    data = _loads(message)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                for item in data if isinstance(data, list) else [data]:
+                    if not isinstance(item, dict):
+                        continue
+                    if item.get('id') is not None:
+                        self._deliver(item)
+                    elif isinstance(item.get('method'), str):
+                        _invalidate_polls()
+                        self._broadcast({'method': item['method'], 'params': item.get('params') or []})
+        except Exception:
+            pass
+        finally:
+            self._drop(ws)
+
+    def _deliver(self, item: Dict[str, Any]) -> None:
+        with self._lock:
+            waiter = self._pending.pop(item['id'], None)
+        if waiter is None:
+            return
+        waiter.replies.append(item)
+        if len(waiter.replies) >= waiter.expected:
+            waiter.event.set()
+
+    def _broadcast(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for queue in listeners:
+            try:
+                queue.put_nowait(event)
+            except Full:
+                pass
+
+    def _drop(self, ws: Any) -> None:
+        with self._lock:
+            if self._ws is not ws:
+                return
+            self._ws = None
+            self._retry_at = time.monotonic() + WS_RECONNECT_DELAY_SECONDS
+            waiters = set(self._pending.values())
+            self._pending.clear()
+        self._close_quietly(ws)
+        for waiter in waiters:
+            waiter.closed = True
+            waiter.event.set()
+
+    @staticmethod
+    def _close_quietly(ws: Any) -> None:
+        try:
+            ws.close()
+        except Exception:
+            pass
+
+
+_ARIA2_WS = _Aria2WebSocket()
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _rpc_params(token: Optional[str], params: Iterable[JsonValue]) -> List[JsonValue]:
+    return [token, *params] if token else list(params)
+
+
+def _send_rpc(url: str, envelope: Any) -> Tuple[Optional[JsonValue], Optional[str]]:
+    """Send a JSON-RPC envelope (single or batch) and return the decoded reply.
+
+    Uses the shared WebSocket when aria2 accepts one, otherwise HTTP. An
+    already-encoded ``bytes`` envelope always goes over HTTP.
+    """
+    encoded = envelope.__class__ is bytes
+    ws_url = None if encoded else _websocket_url(url)
+    if ws_url:
+        try:
+            reply = _ARIA2_WS.request(ws_url, envelope, RPC_TIMEOUT_SECONDS)
+        except OSError as exc:
+            return None, f'Failed to reach aria2 RPC: {exc}'
+        if reply is not None:
+            return reply, None
 
     try:
-        with urllib.request.urlopen(request_obj, timeout=RPC_TIMEOUT_SECONDS) as response:
-            response_body = response.read().decode('utf-8')
-    except urllib.error.HTTPError as exc:
+        response_body = _post_rpc(url, envelope if encoded else _dumps(envelope))
+    except RpcHTTPError as exc:
         return None, f'aria2 RPC HTTP error {exc.code}: {exc.reason}'
-    except urllib.error.URLError as exc:
-        reason = getattr(exc, 'reason', None)
-        return None, f'Failed to reach aria2 RPC: {reason or exc}'
+    except OSError as exc:
+        return None, f'Failed to reach aria2 RPC: {exc}'
     except Exception as exc:  # pragma: no cover - defensive safety
         return None, f'Unexpected error contacting aria2 RPC: {exc}'
 
     try:
-        payload_json = json.loads(response_body)
-    except json.JSONDecodeError:
+        return _loads(response_body), None
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return None, 'aria2 RPC returned malformed JSON'
 
+
+def _rpc_result(payload_json: Any) -> RpcResult:
+    """Extract (result, error_message) from one JSON-RPC response object."""
     if isinstance(payload_json, dict) and 'error' in payload_json:
         error_obj = payload_json['error']
         if isinstance(error_obj, dict):
@@ -97,7 +424,144 @@ def call_rpc(method: str, *params: JsonValue) -> RpcResult:
     return result, None
 
 
+# method -> encoded envelope up to the params value; ids only matter for
+# WebSocket multiplexing, so HTTP calls share one constant id.
+_ENVELOPE_PREFIXES: Dict[str, bytes] = {}
+
+
+def _encode_call(method: str, rpc_params: List[JsonValue]) -> bytes:
+    prefix = _ENVELOPE_PREFIXES.get(method)
+    if prefix is None:
+        prefix = _ENVELOPE_PREFIXES.setdefault(
+            method,
+            b'{"jsonrpc":"2.0","id":"aria_downloader","method":' + _dumps(method) + b',"params":',
+        )
+    return prefix + _dumps(rpc_params) + b'}'
+
+
+def call_rpc(method: str, *params: JsonValue) -> RpcResult:
+    """Call aria2 JSON-RPC and return (result, error_message)."""
+    url, token = _rpc_config()
+    rpc_params = _rpc_params(token, params)
+    if _websocket_url(url):
+        envelope: Any = {
+            'jsonrpc': '2.0',
+            'id': 'aria_downloader',
+            'method': method,
+            'params': rpc_params,
+        }
+    else:
+        envelope = _encode_call(method, rpc_params)
+    payload_json, error = _send_rpc(url, envelope)
+    if error:
+        return None, error
+    return _rpc_result(payload_json)
+
+
+def call_rpc_batch(calls: List[Tuple[str, List[JsonValue]]]) -> List[RpcResult]:
+    """Send several aria2 calls in one JSON-RPC batch.
+
+    Returns one (result, error_message) pair per call, in the order given.
+    """
+    if not calls:
+        return []
+    url, token = _rpc_config()
+    envelope = [
+        {'jsonrpc': '2.0', 'id': index, 'method': method, 'params': _rpc_params(token, params)}
+        for index, (method, params) in enumerate(calls)
+    ]
+    payload_json, error = _send_rpc(url, envelope)
+    if error:
+        return [(None, error)] * len(calls)
+    if not isinstance(payload_json, list):
+        # aria2 answers a rejected batch with a single error object.
+        failure = _rpc_result(payload_json)[1] or 'aria2 RPC returned malformed batch response'
+        return [(None, failure)] * len(calls)
+
+    by_id: Dict[Any, Any] = {}
+    for item in payload_json:
+        if isinstance(item, dict):
+            by_id[item.get('id')] = item
+    results: List[RpcResult] = []
+    for index, (method, _) in enumerate(calls):
+        item = by_id.get(index)
+        if item is None:
+            results.append((None, f'aria2 RPC returned no response for {method}'))
+        else:
+            results.append(_rpc_result(item))
+    return results
+
+
+# ----------------------------------------------------------------------
+# Poll coalescing
+
+# key -> (finished_at or None while in flight, future)
+_SINGLE_FLIGHT: Dict[Any, Tuple[Optional[float], Future]] = {}
+_SINGLE_FLIGHT_LOCK = threading.Lock()
+
+
+def _single_flight(key: Any, ttl: float, fn):
+    """Run *fn* once for concurrent callers sharing *key*.
+
+    Callers arriving while a call is in flight wait for its result, and the
+    result is reused for *ttl* seconds after it completes.
+    """
+    with _SINGLE_FLIGHT_LOCK:
+        entry = _SINGLE_FLIGHT.get(key)
+        if entry is not None:
+            finished_at, future = entry
+            if finished_at is None or time.monotonic() - finished_at < ttl:
+                owner = False
+            else:
+                entry = None
+        if entry is None:
+            future = Future()
+            entry = (None, future)
+            _SINGLE_FLIGHT[key] = entry
+            owner = True
+    if not owner:
+        return future.result()
+
+    try:
+        value = fn()
+    except BaseException as exc:
+        with _SINGLE_FLIGHT_LOCK:
+            if _SINGLE_FLIGHT.get(key) is entry:
+                del _SINGLE_FLIGHT[key]
+        future.set_exception(exc)
+        raise
+    with _SINGLE_FLIGHT_LOCK:
+        # Skip re-caching if the entry was invalidated while in flight
+        if _SINGLE_FLIGHT.get(key) is entry:
+            _SINGLE_FLIGHT[key] = (time.monotonic(), future)
+    future.set_result(value)
+    return value
+
+
+def _invalidate_polls() -> None:
+    with _SINGLE_FLIGHT_LOCK:
+        _SINGLE_FLIGHT.clear()
+
+
+def _polled_batch(key: str, calls: List[Tuple[str, List[JsonValue]]]) -> List[RpcResult]:
+    """call_rpc_batch() for read-only poll endpoints, coalesced per *key*."""
+    replies = _single_flight(key, POLL_CACHE_TTL_SECONDS, lambda: call_rpc_batch(calls))
+    if any(error for _, error in replies):
+        with _SINGLE_FLIGHT_LOCK:
+            _SINGLE_FLIGHT.pop(key, None)
+    return replies
+
+
 def _coerce_int(value: Any) -> int:
+    # aria2 reports numbers as decimal strings; check that case first
+    value_type = type(value)
+    if value_type is str:
+        try:
+            return int(value, 10)
+        except ValueError:
+            return 0
+    if value_type is int:
+        return value
     if value is None:
         return 0
     if isinstance(value, int):
@@ -109,95 +573,161 @@ def _coerce_int(value: Any) -> int:
 
 
 def _guess_name(task: Dict[str, Any]) -> str:
-    bt_info = task.get('bittorrent') or {}
-    info = bt_info.get('info') if isinstance(bt_info, dict) else None
-    if isinstance(info, dict):
-        name = info.get('name')
-        if isinstance(name, str) and name:
-            return name
-
-    files = task.get('files') or []
+    bt_info = task.get('bittorrent')
+    if bt_info.__class__ is dict:
+        info = bt_info.get('info')
+        if info.__class__ is dict:
+            name = info.get('name')
+            if name and name.__class__ is str:
+                return name
+
+    files = task.get('files')
+    if not files:
+        return task.get('gid', '')
     for file_entry in files:
-        if not isinstance(file_entry, dict):
+        if file_entry.__class__ is not dict:
             continue
         path = file_entry.get('path')
-        if isinstance(path, str) and path:
-            return os.path.basename(path)
+        if path and path.__class__ is str:
+            return path.rpartition('/')[2]
         uris = file_entry.get('uris')
-        if isinstance(uris, list):
+        if uris.__class__ is list:
             for uri_obj in uris:
-                if not isinstance(uri_obj, dict):
+                if uri_obj.__class__ is not dict:
                     continue
                 uri = uri_obj.get('uri')
-                if isinstance(uri, str) and uri:
-                    return uri.rsplit('/', 1)[-1]
+                if uri and uri.__class__ is str:
+                    return uri.rpartition('/')[2]
     return task.get('gid', '')
 
 
 def _simplify_task(task: Dict[str, Any]) -> Dict[str, Any]:
-    total = _coerce_int(task.get('totalLength'))
-    completed = _coerce_int(task.get('completedLength'))
-    download_speed = _coerce_int(task.get('downloadSpeed'))
-    upload_speed = _coerce_int(task.get('uploadSpeed'))
+    get = task.get
+    total = _coerce_int(get('totalLength'))
+    completed = _coerce_int(get('completedLength'))
 
     progress = 0.0
     if total > 0:
-        progress = min(max(completed / total, 0.0), 1.0)
+        if 0 <= completed <= total:
+            progress = completed / total
+        else:
+            progress = min(max(completed / total, 0.0), 1.0)
 
     return {
-        'gid': task.get('gid'),
-        'status': task.get('status'),
+        'gid': get('gid'),
+        'status': get('status'),
         'name': _guess_name(task),
         'totalLength': total,
         'completedLength': completed,
-        'downloadSpeed': download_speed,
-        'uploadSpeed': upload_speed,
-        'connections': _coerce_int(task.get('connections')),
+        'downloadSpeed': _coerce_int(get('downloadSpeed')),
+        'uploadSpeed': _coerce_int(get('uploadSpeed')),
+        'connections': _coerce_int(get('connections')),
         'progress': progress,
-        'dir': task.get('dir'),
-        'errorMessage': task.get('errorMessage'),
-        'followedBy': task.get('followedBy'),
-        'verifiedLength': _coerce_int(task.get('verifiedLength')),
+        'dir': get('dir'),
+        'errorMessage': get('errorMessage'),
+        'followedBy': get('followedBy'),
+        'verifiedLength': _coerce_int(get('verifiedLength')),
     }
 
 
-def _call_and_wrap(method: str, *params: JsonValue) -> Tuple[Optional[JsonValue], Optional[str]]:
-    result, error = call_rpc(method, *params)
-    return result, error
+def _json_response(body: Dict[str, Any]) -> Response:
+    return Response(_dumps(body), mimetype='application/json')
+
+
+def _payload_etag(data: Any) -> str:
+    return hashlib.blake2b(_dumps(data), digest_size=8).hexdigest()
+
+
+def _task_groups_etag(groups: Iterable[Tuple[str, Any]]) -> str:
+    """Hash the task lists one task at a time instead of encoding them whole."""
+    digest = hashlib.blake2b(digest_size=8)
+    for key, items in groups:
+        digest.update(b'\x00' + key.encode('ascii') + b'\x00')
+        for task in items or ():
+            digest.update(_dumps(task))
+            digest.update(b'\x1e')
+    return digest.hexdigest()
+
+
+def _revalidated(response: Response, etag: str) -> Response:
+    # no-cache: the browser may keep the body but must revalidate every poll
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _not_modified(etag: str) -> Response:
+    return _revalidated(Response(status=304), etag)
 
 
 def _json_success(data: Any, status_code: int = 200):
-    return jsonify({'ok': True, 'data': data}), status_code
+    return _json_response({'ok': True, 'data': data}), status_code
 
 
 def _json_error(message: str, status_code: int = 500):
-    return jsonify({'ok': False, 'error': message}), status_code
+    return _json_response({'ok': False, 'error': message}), status_code
 
 
 # ----------------------------------------------------------------------
 # Framework shell helpers
 
 
+# Parsed STATE_FILE keyed by (st_mtime_ns, st_size); status polling reads the
+# tracked shell far more often than it changes.
+_STATE_CACHE: Tuple[Optional[Tuple[int, int]], Optional[Dict[str, Any]]] = (None, None)
+
+
 def _load_shell_state() -> Optional[Dict[str, Any]]:
+    global _STATE_CACHE
     try:
-        return json.loads(STATE_FILE.read_text())
+        st = os.stat(STATE_FILE)
     except FileNotFoundError:
-        return None
-    except json.JSONDecodeError:
+        _STATE_CACHE = (None, None)
         return None
     except Exception:
         return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached_key, cached = _STATE_CACHE
+    if cached_key != key:
+        try:
+            cached = _loads(STATE_FILE.read_bytes())
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            cached = None
+        except Exception:
+            return None
+        if not isinstance(cached, dict):
+            cached = None
+        _STATE_CACHE = (key, cached)
+    # Callers update the returned dict before saving it back
+    return dict(cached) if cached is not None else None
 
 
 def _save_shell_state(data: Dict[str, Any]) -> None:
+    global _STATE_CACHE
     STATE_DIR.mkdir(parents=True, exist_ok=True)
     tmp_path = STATE_FILE.with_suffix('.tmp')
-    with tmp_path.open('w', encoding='utf-8') as fh:
-        json.dump(data, fh, indent=2)
-    tmp_path.replace(STATE_FILE)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(_dumps(data))
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, STATE_FILE)
+    try:
+        st = os.stat(STATE_FILE)
+    except OSError:
+        _STATE_CACHE = (None, None)
+    else:
+        _STATE_CACHE = ((st.st_mtime_ns, st.st_size), dict(data))
 
 
 def _clear_shell_state() -> None:
+    global _STATE_CACHE
+    _STATE_CACHE = (None, None)
     try:
         STATE_FILE.unlink()
     except FileNotFoundError:
@@ -230,11 +760,11 @@ def root_status():
 
 @aria_downloader_bp.get('/status')
 def status():
-    version, error = _call_and_wrap('aria2.getVersion')
-    if error:
-        return _json_error(error, 502)
-
-    stats, error = _call_and_wrap('aria2.getGlobalStat')
+    (version, error), (stats, stats_error) = _polled_batch('status', [
+        ('aria2.getVersion', []),
+        ('aria2.getGlobalStat', []),
+    ])
+    error = error or stats_error
     if error:
         return _json_error(error, 502)
 
@@ -242,36 +772,44 @@ def status():
         'version': version,
         'globalStat': stats,
     }
-    return _json_success(data)
+    etag = _payload_etag(data)
+    if request.if_none_match.contains(etag):
+        return _not_modified(etag)
+    response, status_code = _json_success(data)
+    return _revalidated(response, etag), status_code
 
 
 @aria_downloader_bp.get('/downloads')
 def downloads():
-    active, error = _call_and_wrap('aria2.tellActive')
-    if error:
-        return _json_error(error, 502)
-
-    waiting, error = _call_and_wrap('aria2.tellWaiting', 0, MAX_RESULT_ITEMS)
-    if error:
-        return _json_error(error, 502)
-
-    stopped, error = _call_and_wrap('aria2.tellStopped', 0, MAX_RESULT_ITEMS)
-    if error:
-        return _json_error(error, 502)
-
-    def _simplify(items: Iterable[Any]) -> List[Dict[str, Any]]:
-        simplified: List[Dict[str, Any]] = []
-        for task in items or []:
-            if isinstance(task, dict):
-                simplified.append(_simplify_task(task))
-        return simplified
-
-    data = {
-        'active': _simplify(active),
-        'waiting': _simplify(waiting),
-        'stopped': _simplify(stopped),
-    }
-    return _json_success(data)
+    replies = _polled_batch('downloads', [
+        ('aria2.tellActive', [TASK_KEYS]),
+        ('aria2.tellWaiting', [0, MAX_RESULT_ITEMS, TASK_KEYS]),
+        ('aria2.tellStopped', [0, MAX_RESULT_ITEMS, TASK_KEYS]),
+    ])
+    for _, error in replies:
+        if error:
+            return _json_error(error, 502)
+    (active, _), (waiting, _), (stopped, _) = replies
+    groups = (('active', active), ('waiting', waiting), ('stopped', stopped))
+    # Fingerprint the raw aria2 lists so an unchanged poll skips simplification
+    etag = _task_groups_etag(groups)
+    if request.if_none_match.contains(etag):
+        return _not_modified(etag)
+    return _revalidated(Response(_stream_task_groups(groups), mimetype='application/json'), etag)
+
+
+def _stream_task_groups(groups: Iterable[Tuple[str, Any]]) -> Iterator[bytes]:
+    """Yield the /downloads envelope one simplified task at a time."""
+    yield b'{"ok":true,"data":{'
+    for index, (key, items) in enumerate(groups):
+        yield (b',"' if index else b'"') + key.encode('ascii') + b'":['
+        separator = b''
+        for task in items or ():
+            if task.__class__ is dict:
+                yield separator + _dumps(_simplify_task(task))
+                separator = b','
+        yield b']'
+    yield b'}}'
 
 
 @aria_downloader_bp.post('/add')
@@ -294,7 +832,8 @@ def add_download():
     if options:
         params.append(options)
 
-    result, error = _call_and_wrap('aria2.addUri', *params)
+    result, error = call_rpc('aria2.addUri', *params)
+    _invalidate_polls()
     if error:
         return _json_error(error, 502)
 
@@ -323,25 +862,20 @@ def control():
     if action in ACTION_METHOD_MAP:
         if not gids or not isinstance(gids, list):
             return _json_error('"gids" array is required for this action', 400)
-        processed: List[str] = []
-        errors: List[str] = []
+        if not all(gid.__class__ is str for gid in gids):
+            return _json_error('Invalid GID in list', 400)
         method = ACTION_METHOD_MAP[action]
-        for gid in gids:
-            if not isinstance(gid, str):
-                errors.append('Invalid GID in list')
-                continue
-            _, error = _call_and_wrap(method, gid)
-            if error:
-                errors.append(f'{gid}: {error}')
-            else:
-                processed.append(gid)
-        if errors:
+        replies = call_rpc_batch([(method, [gid]) for gid in gids])
+        _invalidate_polls()
+        if any(error for _, error in replies):
+            errors = [f'{gid}: {error}' for gid, (_, error) in zip(gids, replies) if error]
             return _json_error('; '.join(errors), 502)
-        return _json_success({'processed': processed})
+        return _json_success({'processed': gids})
 
     if action in BULK_ACTIONS:
         method = BULK_ACTIONS[action]
-        result, error = _call_and_wrap(method)
+        result, error = call_rpc(method)
+        _invalidate_polls()
         if error:
             return _json_error(error, 502)
         return _json_success({'result': result})
@@ -356,34 +890,64 @@ def settings():
     per_download = payload.get('perDownload') if isinstance(payload.get('perDownload'), dict) else None
     gid = payload.get('gid')
 
-    if global_opts:
-        _, error = _call_and_wrap('aria2.changeGlobalOption', global_opts)
-        if error:
-            return _json_error(error, 502)
-
-    if per_download:
-        if not gid or not isinstance(gid, str):
-            return _json_error('A valid "gid" is required for per-download settings', 400)
-        _, error = _call_and_wrap('aria2.changeOption', gid, per_download)
-        if error:
-            return _json_error(error, 502)
-
     if not global_opts and not per_download:
         return _json_error('No settings provided', 400)
+    if per_download and (not gid or not isinstance(gid, str)):
+        return _json_error('A valid "gid" is required for per-download settings', 400)
+
+    labels: List[str] = []
+    calls: List[Tuple[str, List[JsonValue]]] = []
+    if global_opts:
+        labels.append('global')
+        calls.append(('aria2.changeGlobalOption', [global_opts]))
+    if per_download:
+        labels.append(gid)
+        calls.append(('aria2.changeOption', [gid, per_download]))
+    replies = call_rpc_batch(calls)
+    _invalidate_polls()
+    if any(error for _, error in replies):
+        errors = [f'{label}: {error}' for label, (_, error) in zip(labels, replies) if error]
+        return _json_error('; '.join(errors), 502)
 
     return _json_success({'updated': True})
 
 
+@aria_downloader_bp.get('/events')
+def events_stream():
+    """Stream aria2 download notifications as server-sent events."""
+    url, _ = _rpc_config()
+    ws_url = _websocket_url(url)
+    queue: Queue = Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+    _ARIA2_WS.add_listener(queue)
+
+    def generate():
+        try:
+            while True:
+                if ws_url:
+                    _ARIA2_WS.connect(ws_url)
+                try:
+                    event = queue.get(timeout=EVENT_KEEPALIVE_SECONDS)
+                except Empty:
+                    yield ': keep-alive\n\n'
+                    continue
+                yield f"data: {_dumps(event).decode('utf-8')}\n\n"
+        finally:
+            _ARIA2_WS.remove_listener(queue)
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
 # ----------------------------------------------------------------------
 # Framework shell endpoints
 
 
 def _sanitize_env(env: Dict[str, Any]) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
-    sanitized: Dict[str, str] = {}
-    for key, value in env.items():
-        if not isinstance(key, str):
-            return None, 'Environment keys must be strings'
-        sanitized[key] = str(value)
+    if not all(key.__class__ is str for key in env):
+        return None, 'Environment keys must be strings'
+    sanitized = {key: value if value.__class__ is str else str(value) for key, value in env.items()}
     return sanitized, None
 
 
@@ -394,13 +958,46 @@ def list_framework_shells():
     return _json_success({'shells': shells})
 
 
+# shell id -> (log fingerprint, logs payload from describe())
+_LOG_TAIL_CACHE: Dict[str, Tuple[Tuple[Any, ...], Any]] = {}
+
+
+def _log_fingerprint(record: Any, tail_lines: int) -> Optional[Tuple[Any, ...]]:
+    parts: List[Any] = [tail_lines]
+    for path in (record.stdout_log, record.stderr_log):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            parts.append(None)
+        except OSError:
+            return None
+        else:
+            parts.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(parts)
+
+
+def _describe_with_logs(mgr: FrameworkShellManager, record: Any, tail_lines: int) -> Dict[str, Any]:
+    """describe() with log tails, re-reading the logs only when they changed."""
+    fingerprint = _log_fingerprint(record, tail_lines)
+    cached = _LOG_TAIL_CACHE.get(record.id)
+    if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+        described = mgr.describe(record)
+        described['logs'] = cached[1]
+        return described
+    described = mgr.describe(record, include_logs=True, tail_lines=tail_lines)
+    if fingerprint is not None:
+        _LOG_TAIL_CACHE.clear()
+        _LOG_TAIL_CACHE[record.id] = (fingerprint, described.get('logs'))
+    return described
+
+
 @aria_downloader_bp.get('/shell')
 def get_tracked_shell():
     state = _load_shell_state()
     if not state or 'id' not in state:
         return _json_success({'shell': None})
 
-    include_logs = request.args.get('logs', 'false').lower() in {'1', 'true', 'yes'}
+    include_logs = request.args.get('logs', 'false').lower() in TRUTHY_ARGS
     shell_id = str(state.get('id'))
     mgr = _framework_manager()
     record = mgr.get_shell(shell_id)
@@ -414,7 +1011,10 @@ def get_tracked_shell():
             tail_lines = max(0, int(tail_param))
         except ValueError:
             tail_lines = DEFAULT_LOG_TAIL_LINES
-    described = mgr.describe(record, include_logs=include_logs, tail_lines=tail_lines if include_logs else 0)
+    if include_logs:
+        described = _describe_with_logs(mgr, record, tail_lines)
+    else:
+        described = mgr.describe(record)
     return _json_success(_wrap_shell_response(described, state))
 
 
@@ -491,74 +1091,92 @@ def spawn_shell():
     return _json_success(_wrap_shell_response(described, shell_config), 201)
 
 
-@aria_downloader_bp.post('/shell/action')
-def shell_action():
-    payload = request.get_json(silent=True) or {}
-    action = (payload.get('action') or '').strip().lower()
-    if not action:
-        return _json_error('"action" is required', 400)
+def _adopt_shell(action: str, payload: Dict[str, Any]):
+    shell_id = payload.get('id')
+    if not isinstance(shell_id, str) or not shell_id:
+        return _json_error('"id" is required when adopting a shell', 400)
+    mgr = _framework_manager()
+    record = mgr.get_shell(shell_id)
+    if not record:
+        return _json_error('Shell not found', 404)
+    described = mgr.describe(record)
+    config = {
+        'id': shell_id,
+        'label': described.get('label') or DEFAULT_ARIA2_LABEL,
+        'command': described.get('command'),
+        'cwd': described.get('cwd'),
+        'autostart': bool(described.get('autostart', False)),
+        'saved_at': time.time(),
+    }
+    _save_shell_state(config)
+    return _json_success(_wrap_shell_response(described, config))
 
-    if action == 'adopt':
-        shell_id = payload.get('id')
-        if not isinstance(shell_id, str) or not shell_id:
-            return _json_error('"id" is required when adopting a shell', 400)
-        mgr = _framework_manager()
-        record = mgr.get_shell(shell_id)
-        if not record:
-            return _json_error('Shell not found', 404)
-        described = mgr.describe(record)
-        config = {
-            'id': shell_id,
-            'label': described.get('label') or DEFAULT_ARIA2_LABEL,
-            'command': described.get('command'),
-            'cwd': described.get('cwd'),
-            'autostart': bool(described.get('autostart', False)),
-            'saved_at': time.time(),
-        }
-        _save_shell_state(config)
-        return _json_success(_wrap_shell_response(described, config))
 
+def _remove_tracked_shell(action: str, payload: Dict[str, Any]):
     state = _load_shell_state()
-    if action == 'remove':
-        if not state or 'id' not in state:
-            _clear_shell_state()
-            return _json_success({'shell': None})
-        mgr = _framework_manager()
-        try:
-            mgr.remove_shell(state['id'], force=bool(payload.get('force')))
-        except KeyError:
-            pass
-        except Exception as exc:
-            return _json_error(f'Failed to remove shell: {exc}', 500)
+    if not state or 'id' not in state:
         _clear_shell_state()
         return _json_success({'shell': None})
+    mgr = _framework_manager()
+    try:
+        mgr.remove_shell(state['id'], force=bool(payload.get('force')))
+    except KeyError:
+        pass
+    except Exception as exc:
+        return _json_error(f'Failed to remove shell: {exc}', 500)
+    _clear_shell_state()
+    return _json_success({'shell': None})
+
 
+_SHELL_LIFECYCLE = {
+    'stop': lambda mgr, shell_id: mgr.terminate_shell(shell_id, force=False),
+    'terminate': lambda mgr, shell_id: mgr.terminate_shell(shell_id, force=False),
+    'kill': lambda mgr, shell_id: mgr.terminate_shell(shell_id, force=True),
+    'force': lambda mgr, shell_id: mgr.terminate_shell(shell_id, force=True),
+    'restart': lambda mgr, shell_id: mgr.restart_shell(shell_id),
+}
+
+
+def _apply_lifecycle_action(action: str, payload: Dict[str, Any]):
+    state = _load_shell_state()
     if not state or 'id' not in state:
         return _json_error('No aria2 framework shell is currently tracked.', 404)
 
     shell_id = str(state['id'])
     mgr = _framework_manager()
     try:
-        if action in {'stop', 'terminate'}:
-            record = mgr.terminate_shell(shell_id, force=False)
-        elif action in {'kill', 'force'}:
-            record = mgr.terminate_shell(shell_id, force=True)
-        elif action == 'restart':
-            record = mgr.restart_shell(shell_id)
-        else:
-            return _json_error(f'Unsupported action \"{action}\"', 400)
+        record = _SHELL_LIFECYCLE[action](mgr, shell_id)
     except KeyError:
         _clear_shell_state()
         return _json_error('Shell not found', 404)
     except Exception as exc:
         return _json_error(f'Shell action failed: {exc}', 500)
 
-    if isinstance(state, dict):
-        if action == 'restart' and hasattr(record, 'created_at') and record.created_at is not None:
-            state['created_at'] = record.created_at
-        state['last_action'] = action
-        state['updated_at'] = time.time()
-        _save_shell_state(state)
+    if action == 'restart' and getattr(record, 'created_at', None) is not None:
+        state['created_at'] = record.created_at
+    state['last_action'] = action
+    state['updated_at'] = time.time()
+    _save_shell_state(state)
 
     described = mgr.describe(record)
     return _json_success(_wrap_shell_response(described, state))
+
+
+_SHELL_ACTION_HANDLERS = {
+    'adopt': _adopt_shell,
+    'remove': _remove_tracked_shell,
+    **{name: _apply_lifecycle_action for name in _SHELL_LIFECYCLE},
+}
+
+
+@aria_downloader_bp.post('/shell/action')
+def shell_action():
+    payload = request.get_json(silent=True) or {}
+    action = (payload.get('action') or '').strip().lower()
+    if not action:
+        return _json_error('"action" is required', 400)
+
+    handler = _SHELL_ACTION_HANDLERS.get(action)
+    if handler is None:
+        return _json_error(f'Unsupported action "{action}"', 400)
+    return handler(action, payload)
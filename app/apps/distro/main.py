@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
+import re
 import subprocess
-import shlex
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Set, Tuple
 
-from flask import Blueprint, jsonify, request, current_app
+from flask import Blueprint, Response, current_app, g, has_request_context, request
 
 from app.framework_shells import FrameworkShellManager
 
 from .plugins import get_plugin
+from .plugins.chroot import shell_quote
+
+try:  # Optional dependency for faster config/state encoding
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - orjson may be unavailable.
+    orjson = None  # type: ignore
 
 BASE_DIR = Path(__file__).parent
 CONFIG_PATH = BASE_DIR / "config" / "containers.json"
@@ -25,6 +37,21 @@ framework_shells = FrameworkShellManager()
 distro_bp = Blueprint("distro", __name__)
 
 LOG_TAIL_BYTES = 4096
+LOG_TAIL_CHUNK_BYTES = 8192
+LOG_TAIL_MAX_BYTES = 64 * 1024
+
+
+# Scripts already confirmed executable; checked once per process
+_EXECUTABLE_SCRIPTS: Set[Path] = set()
+
+
+def _ensure_executable(script_path: Path) -> None:
+    if script_path in _EXECUTABLE_SCRIPTS:
+        return
+    mode = os.stat(script_path).st_mode
+    if mode & 0o111 != 0o111:
+        os.chmod(script_path, mode | 0o111)
+    _EXECUTABLE_SCRIPTS.add(script_path)
 
 
 def _run_script(script_name: str, args: list[str] | None = None):
@@ -33,7 +60,7 @@ def _run_script(script_name: str, args: list[str] | None = None):
     if args is None:
         args = []
     try:
-        subprocess.run(['chmod', '+x', str(script_path)], check=True)
+        _ensure_executable(script_path)
         result = subprocess.run([str(script_path)] + args, capture_output=True, text=True, check=True)
         return result.stdout, None
     except Exception as exc:
@@ -43,65 +70,320 @@ def _run_script(script_name: str, args: list[str] | None = None):
 # ---------------------------------------------------------------------------
 # Config / state helpers
 
+# Parsed JSON keyed by path; each entry holds the (st_mtime_ns, st_size) it
+# was read at. Loaders hand out the cached object itself: config edits copy
+# the list before changing it, state edits go through _mutate_state, which
+# mutates a copy. Saves replace the entry with the object written.
+_JSON_CACHE: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _dumps(data: Any, *, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    # Match orjson: emit UTF-8 directly rather than \u escapes
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json_cached(path: Path) -> Any:
+    """Parse ``path`` unless the cached copy is current.
+
+    The stat doubles as the existence check: a missing file raises
+    FileNotFoundError for the caller to handle.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _JSON_CACHE.pop(path, None)
+        raise
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    data = _loads(path.read_bytes())
+    _JSON_CACHE[path] = (key, data)
+    return data
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write ``data`` to a sibling temp file, fsync it, then rename over ``path``."""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    # Unbuffered fd writes: the payload is already encoded bytes
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+# Path -> (cache key, blake2b digest) of the bytes we last wrote there.
+_WRITTEN_DIGESTS: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def _write_json_cached(path: Path, data: Any, encoded: bytes) -> None:
+    """Atomically write ``encoded`` and cache ``data`` as the parsed content.
+
+    Skips the write when the file is unchanged since we last wrote exactly
+    these bytes (e.g. re-saving the same attachments list).
+    """
+    digest = hashlib.blake2b(encoded, digest_size=16).digest()
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    if st is not None:
+        key = (st.st_mtime_ns, st.st_size)
+        if _WRITTEN_DIGESTS.get(path) == (key, digest):
+            _JSON_CACHE[path] = (key, data)
+            return
+    try:
+        _atomic_write(path, encoded)
+        st = path.stat()
+    except BaseException:
+        _JSON_CACHE.pop(path, None)
+        _WRITTEN_DIGESTS.pop(path, None)
+        raise
+    key = (st.st_mtime_ns, st.st_size)
+    _JSON_CACHE[path] = (key, data)
+    _WRITTEN_DIGESTS[path] = (key, digest)
+
+
 def _save_config(containers: List[Dict]) -> None:
+    global _SNAPSHOT
+    _SNAPSHOT = None
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    CONFIG_PATH.write_text(json.dumps(containers, indent=2), encoding='utf-8')
+    # containers.json is edited by hand, so keep it indented
+    _write_json_cached(CONFIG_PATH, containers, _dumps(containers, pretty=True))
 
 def _load_config() -> List[Dict]:
-    if not CONFIG_PATH.exists():
-        return []
     try:
-        with CONFIG_PATH.open('r', encoding='utf-8') as fh:
-            data = json.load(fh)
+        data = _read_json_cached(CONFIG_PATH)
         if isinstance(data, list):
             return data
         raise ValueError('Container config must be a JSON array')
+    except FileNotFoundError:
+        return []
     except json.JSONDecodeError as exc:
         raise ValueError(f'Failed to parse container config: {exc}')
 
 
+def _build_index(containers: List[Dict]) -> Dict[str, int]:
+    index: Dict[str, int] = {}
+    for idx, item in enumerate(containers):
+        index.setdefault(item.get('id'), idx)
+    return index
+
+
+def _compute_static_fields(container: Dict) -> Dict:
+    container_id = container.get('id')
+    return {
+        'id': container_id,
+        'label': container.get('label') or container_id,
+        'type': container.get('type'),
+        'rootfs': _expand_path(container.get('rootfs')),
+    }
+
+
+@dataclass
+class ConfigSnapshot:
+    """A loaded container list plus lookups derived from it.
+
+    ``key`` is the (mtime_ns, size) cache key the list was read at, or None
+    for a list that is not backed by the config cache.
+    """
+
+    containers: List[Dict]
+    key: Any = None
+    index: Dict[str, int] = field(default_factory=dict)
+    static: Dict[str, Dict] = field(default_factory=dict)
+
+    def static_fields(self, container: Dict) -> Dict:
+        """Serialized fields that depend only on the stored definition.
+
+        Memoised for containers that belong to this snapshot; callers must
+        copy the result before adding to it.
+        """
+        container_id = container.get('id')
+        idx = self.index.get(container_id)
+        if idx is None or self.containers[idx] is not container:
+            return _compute_static_fields(container)
+        fields = self.static.get(container_id)
+        if fields is None:
+            fields = self.static[container_id] = _compute_static_fields(container)
+        return fields
+
+
+# Snapshot of the cached config list; rebuilt when the cache key changes.
+_SNAPSHOT: ConfigSnapshot | None = None
+
+
+def _config_snapshot() -> ConfigSnapshot:
+    """Load the config and return its snapshot, reused while it is unchanged."""
+    global _SNAPSHOT
+    containers = _load_config()
+    cached = _JSON_CACHE.get(CONFIG_PATH)
+    if cached is None or cached[1] is not containers:
+        return ConfigSnapshot(containers, index=_build_index(containers))
+    snapshot = _SNAPSHOT
+    if snapshot is None or snapshot.key != cached[0] or snapshot.containers is not containers:
+        snapshot = _SNAPSHOT = ConfigSnapshot(containers, cached[0], _build_index(containers))
+    return snapshot
+
+
 def _load_state() -> Dict:
-    if not STATE_PATH.exists():
-        return {"containers": {}}
     try:
-        with STATE_PATH.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        data = _read_json_cached(STATE_PATH)
         if not isinstance(data, dict):
             return {"containers": {}}
-        data.setdefault("containers", {})
+        if "containers" not in data:
+            # Never add the key to the cached object other readers share
+            return {**data, "containers": {}}
         return data
-    except json.JSONDecodeError:
+    except (FileNotFoundError, json.JSONDecodeError):
         return {"containers": {}}
 
 
 def _save_state(state: Dict) -> None:
-    STATE_PATH.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    global _ATTACHMENT_INDEX
+    _ATTACHMENT_INDEX = (None, {})
+    _write_json_cached(STATE_PATH, state, _dumps(state))
+
+
+# {sid: [container id, ...]} for the cached state, tagged with the cache key
+# it was built from.
+_ATTACHMENT_INDEX: Tuple[Any, Dict[str, List[str]]] = (None, {})
+
+
+def _build_attachment_index(state: Dict) -> Dict[str, List[str]]:
+    mapping: Dict[str, List[str]] = {}
+    for container_id, entry in state.get('containers', {}).items():
+        if not isinstance(entry, dict):
+            continue
+        for sid in entry.get('attachments', []) or []:
+            mapping.setdefault(sid, []).append(container_id)
+    return mapping
+
+
+def _attachment_index(state: Dict) -> Dict[str, List[str]]:
+    """sid -> container ids for ``state``, reused while state.json is unchanged."""
+    global _ATTACHMENT_INDEX
+    cached = _JSON_CACHE.get(STATE_PATH)
+    if cached is None or cached[1] is not state:
+        return _build_attachment_index(state)
+    if _ATTACHMENT_INDEX[0] != cached[0]:
+        _ATTACHMENT_INDEX = (cached[0], _build_attachment_index(state))
+    return _ATTACHMENT_INDEX[1]
+
+
+def _state_for_request() -> Dict:
+    """state.json loaded at most once per request (directly outside one)."""
+    if not has_request_context():
+        return _load_state()
+    state = g.get('distro_state')
+    if state is None:
+        state = g.distro_state = _load_state()
+    return state
 
 
 def _get_state_entry(container_id: str) -> Dict:
-    state = _load_state()
+    state = _state_for_request()
     return state["containers"].get(container_id, {})
 
 
-def _update_container_state(container_id: str, updates: Dict) -> None:
-    state = _load_state()
+_STATE_LOCK = threading.RLock()
+
+
+def _mutate_state(mutator: Callable[[Dict], bool]) -> None:
+    """Load state, apply ``mutator`` and save it back under one lock.
+
+    ``mutator`` works on a copy of the cached state (down to the containers
+    mapping; _apply_state_patch copies the entries it touches), so readers
+    iterating the cached object are never disturbed. The copy is published
+    through _save_state. ``mutator`` returns False when it left the state
+    unchanged.
+    """
+    with _STATE_LOCK:
+        loaded = _load_state()
+        state = {**loaded, 'containers': dict(loaded.get('containers') or {})}
+        if mutator(state):
+            _save_state(state)
+        else:
+            state = loaded
+    if has_request_context():
+        g.distro_state = state
+
+
+def _apply_state_patch(state: Dict, container_id: str, updates: Dict | None) -> bool:
+    """Apply one container patch to ``state``; ``updates=None`` drops the entry."""
     containers_state = state.setdefault('containers', {})
-    entry = containers_state.get(container_id, {})
-    if not isinstance(entry, dict):
-        entry = {}
+    if updates is None:
+        return containers_state.pop(container_id, None) is not None
+    entry = containers_state.get(container_id)
+    # Copy: the entry may still be shared with the cached state
+    entry = dict(entry) if isinstance(entry, dict) else {}
     for key, value in updates.items():
         if value is None:
             entry.pop(key, None)
         else:
             entry[key] = value
     containers_state[container_id] = entry
-    _save_state(state)
+    return True
+
+
+def _patch_state(container_id: str, updates: Dict | None) -> None:
+    """Record a state change.
+
+    Inside a request the patch is applied to a request-local copy of the
+    state (so the request reads its own writes) and queued; all queued
+    patches are replayed onto the on-disk state in one locked write when
+    the request finishes. Outside a request the write happens immediately.
+    """
+    if not has_request_context():
+        _mutate_state(lambda state: _apply_state_patch(state, container_id, updates))
+        return
+    patches = g.get('distro_state_patches')
+    if patches is None:
+        patches = g.distro_state_patches = []
+        # The loaded state is the shared cached object; _apply_state_patch
+        # copies the entries it touches, so copying the mapping is enough
+        state = _state_for_request()
+        g.distro_state = {**state, 'containers': dict(state.get('containers', {}))}
+    patches.append((container_id, updates))
+    _apply_state_patch(g.distro_state, container_id, updates)
+
+
+@distro_bp.after_request
+def _flush_state_patches(response):
+    patches = g.pop('distro_state_patches', None)
+    if patches:
+        def apply(state: Dict) -> bool:
+            changed = False
+            for container_id, updates in patches:
+                changed = _apply_state_patch(state, container_id, updates) or changed
+            return changed
+
+        _mutate_state(apply)
+    return response
+
+
+def _update_container_state(container_id: str, updates: Dict) -> None:
+    _patch_state(container_id, updates)
 
 
 def _clear_state_entry(container_id: str) -> None:
-    state = _load_state()
-    if state.setdefault("containers", {}).pop(container_id, None) is not None:
-        _save_state(state)
+    _patch_state(container_id, None)
 
 
 def _read_log_tail(path: str | None, limit: int = LOG_TAIL_BYTES) -> str:
@@ -121,12 +403,48 @@ def _read_log_tail(path: str | None, limit: int = LOG_TAIL_BYTES) -> str:
         return ''
 
 
+def _tail_file(path: str | None, lines: int) -> List[str]:
+    """Return the last ``lines`` lines of ``path`` without reading the whole file.
+
+    Reads backwards in LOG_TAIL_CHUNK_BYTES steps until enough newlines have
+    been seen, never scanning more than LOG_TAIL_MAX_BYTES.
+    """
+    if not path or lines <= 0:
+        return []
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return []
+    try:
+        end = os.lseek(fd, 0, os.SEEK_END)
+        floor = max(0, end - LOG_TAIL_MAX_BYTES)
+        offset = end
+        chunks: List[bytes] = []
+        newlines = 0
+        while offset > floor and newlines <= lines:
+            step = min(LOG_TAIL_CHUNK_BYTES, offset - floor)
+            offset -= step
+            chunk = os.pread(fd, step, offset)
+            chunks.append(chunk)
+            newlines += chunk.count(b'\n')
+    finally:
+        os.close(fd)
+    data = b''.join(reversed(chunks)).decode('utf-8', errors='replace')
+    return data.splitlines()[-lines:]
+
+
 # ---------------------------------------------------------------------------
 # Utility helpers
 
 def _expand_path(value: str | None) -> str | None:
     if not value:
         return value
+    return _expand_path_cached(value)
+
+
+@functools.lru_cache(maxsize=512)
+def _expand_path_cached(value: str) -> str:
+    # HOME is fixed for the server's lifetime; cache_clear() if that changes
     return os.path.abspath(os.path.expanduser(value))
 
 
@@ -142,32 +460,87 @@ def _get_shell_record(shell_id: str | None):
     return framework_shells.get_shell(shell_id)
 
 
-def _describe_shell(shell_id: str | None) -> Dict | None:
-    record = _get_shell_record(shell_id)
-    if not record:
-        return None
-    return framework_shells.describe(record)
+def _describe_cached(record, describe_cache: Dict[str, Dict] | None = None) -> Dict:
+    """framework_shells.describe() memoised per shell id for one request."""
+    if describe_cache is None:
+        return framework_shells.describe(record)
+    description = describe_cache.get(record.id)
+    if description is None:
+        description = describe_cache[record.id] = framework_shells.describe(record)
+    return description
 
 
-def _shell_is_running(shell_id: str | None) -> bool:
+def _shell_snapshot(shell_id: str | None, describe_cache: Dict[str, Dict] | None = None) -> Tuple[Any, Dict | None]:
+    """Return ``(record, description)`` for ``shell_id``; ``(None, None)`` if unknown."""
     record = _get_shell_record(shell_id)
     if not record:
+        return None, None
+    return record, _describe_cached(record, describe_cache)
+
+
+def _shell_alive(description: Dict | None) -> bool:
+    if not description:
         return False
-    stats = framework_shells.describe(record).get("stats") or {}
-    return stats.get("alive", False)
+    return bool((description.get("stats") or {}).get("alive"))
 
 
-def _determine_state(plugin, shell_id: str | None) -> str:
-    record = _get_shell_record(shell_id)
+PROC_MOUNTS_PATH = "/proc/self/mounts"
+
+
+_MOUNT_ESCAPE = re.compile(rb'\\([0-7]{3})')
+
+
+def _unescape_mount_field(value: bytes) -> str:
+    # /proc/self/mounts escapes space, tab, newline and backslash as \ooo;
+    # everything else is the raw path bytes, so decode like os.fsdecode does
+    if b'\\' in value:
+        value = _MOUNT_ESCAPE.sub(lambda m: bytes((int(m.group(1), 8),)), value)
+    return value.decode('utf-8', 'surrogateescape')
+
+
+def _read_mountpoints() -> frozenset | None:
+    """Active mount points, or None when /proc/self/mounts cannot be read."""
+    try:
+        with open(PROC_MOUNTS_PATH, 'rb') as fh:
+            lines = fh.read().splitlines()
+    except OSError:
+        return None
+    points = set()
+    for line in lines:
+        fields = line.split(b' ', 2)
+        if len(fields) > 1:
+            points.add(_unescape_mount_field(fields[1]))
+    return frozenset(points)
+
+
+def _request_mountpoints() -> frozenset | None:
+    """_read_mountpoints() at most once per request.
+
+    Only call this once the request's own mount/unmount work is done.
+    """
+    if not has_request_context():
+        return _read_mountpoints()
+    if 'distro_mountpoints' not in g:
+        g.distro_mountpoints = _read_mountpoints()
+    return g.distro_mountpoints
+
+
+def _determine_state(plugin, record, description: Dict | None, mountpoints: frozenset | None = None) -> str:
     if record:
-        stats = framework_shells.describe(record).get("stats") or {}
-        if stats.get("alive"):
+        if _shell_alive(description):
             return "running"
         exit_code = record.exit_code
         if exit_code not in (None, 0):
             return "error"
+    if mountpoints is None:
+        try:
+            if plugin.mount_targets():
+                mountpoints = _request_mountpoints()
+        except Exception:
+            # Leave it None so is_mounted() probes each target with os.path.ismount
+            mountpoints = None
     try:
-        if plugin.is_mounted():
+        if plugin.is_mounted(mountpoints):
             return "mounted"
     except Exception:
         pass
@@ -175,102 +548,244 @@ def _determine_state(plugin, shell_id: str | None) -> str:
 
 
 def _run_command(command: List[str], *, env: Dict[str, str] | None = None) -> subprocess.CompletedProcess:
-    env_map = os.environ.copy()
-    if env:
-        env_map.update(env)
-    return subprocess.run(command, capture_output=True, text=True, env=env_map, check=False)
+    """Run ``command`` and capture its output as raw bytes.
+
+    Most callers only look at ``returncode``; use :func:`_decode_output` on
+    stdout/stderr where they are surfaced to the client.
+    """
+    if not env:
+        return subprocess.run(command, capture_output=True, check=False)
+    return subprocess.run(command, capture_output=True, env={**os.environ, **env}, check=False)
+
+
+def _decode_output(data: bytes | None) -> str:
+    return data.decode('utf-8', errors='replace') if data else ''
+
+
+# Order-independent blocking work (force unmounts, lazy umounts, shell
+# describes) is fanned out here so a request waits for the slowest call
+# rather than their sum. Jobs must not touch request state (flask.g).
+_EXEC = ThreadPoolExecutor(max_workers=4, thread_name_prefix="distro-worker")
+
+
+def _force_cleanup(plugin) -> None:
+    """Best-effort teardown of a container's mounts; errors are ignored."""
+    futures = [
+        _EXEC.submit(_run_command, plugin.force_unmount_command(), env=plugin.environment()),
+        _EXEC.submit(plugin.unmount, force=True),
+    ]
+    for future in futures:
+        try:
+            future.result()
+        except Exception:
+            pass
+
+
+def _json(payload: Any, status: int = 200) -> Response:
+    """JSON response encoded with _dumps (orjson when available) instead of jsonify."""
+    return current_app.response_class(_dumps(payload), status=status, mimetype="application/json")
 
 
 def _respond_error(message: str, status: int = 400):
-    return jsonify({"ok": False, "error": message}), status
+    return _json({"ok": False, "error": message}, status)
+
+
+# Bodies for fixed-shape responses, encoded once. A fresh Response is built
+# per request since Flask may add headers to the object it is handed.
+_STATUS_BODY = _dumps({"ok": True, "data": {"message": "Distro API ready"}})
+_CONTAINER_NOT_FOUND_BODY = _dumps({"ok": False, "error": "Container not found"})
+
+
+def _constant_response(body: bytes, status: int = 200) -> Response:
+    return Response(body, status=status, mimetype="application/json")
+
+
+_ALLOWED_CONTAINER_KEYS = frozenset({
+    'id', 'type', 'label', 'rootfs', 'environment', 'mounts', 'auto_start', 'notes', 'cwd',
+})
+_SUPPORTED_CONTAINER_TYPES = frozenset({'chroot-distro'})
+# Expected type per optional field; empty values fall back to defaults and
+# are not checked.
+_CONTAINER_FIELD_TYPES: Dict[str, Tuple[type, str]] = {
+    'type': (str, '"type" must be a string'),
+    'label': (str, '"label" must be a string'),
+    'rootfs': (str, '"rootfs" must be a string'),
+    'cwd': (str, '"cwd" must be a string'),
+    'notes': (str, '"notes" must be a string'),
+    'environment': (dict, '"environment" must be an object'),
+    'mounts': (list, '"mounts" must be an array'),
+}
 
 
 def _normalize_container_payload(data: Dict, *, existing: Dict | None = None) -> Dict:
     if not isinstance(data, dict):
         raise ValueError('Payload must be an object')
-    allowed_keys = {'id', 'type', 'label', 'rootfs', 'environment', 'mounts', 'auto_start', 'notes', 'cwd'}
-    result = dict(existing or {})
-    for key in allowed_keys:
-        if key in data:
-            result[key] = data[key]
-    if not result.get('id'):
+    result = {key: data[key] for key in _ALLOWED_CONTAINER_KEYS if key in data}
+    if existing:
+        result = {**existing, **result}
+
+    container_id = result.get('id')
+    if not container_id:
         raise ValueError('"id" is required')
     if existing is None:
-        if not isinstance(result['id'], str):
+        if not isinstance(container_id, str):
             raise ValueError('"id" must be a string')
-        result['id'] = result['id'].strip()
-    result['type'] = (result.get('type') or 'chroot-distro').strip()
-    if result['type'] not in {'chroot-distro'}:
+        container_id = container_id.strip()
+    for key, (expected, message) in _CONTAINER_FIELD_TYPES.items():
+        value = result.get(key)
+        if value and not isinstance(value, expected):
+            raise ValueError(message)
+    container_type = (result.get('type') or 'chroot-distro').strip()
+    if container_type not in _SUPPORTED_CONTAINER_TYPES:
         raise ValueError('Unsupported container type')
-    env = result.get('environment') or {}
-    if not isinstance(env, dict):
-        raise ValueError('"environment" must be an object')
-    result['environment'] = env
     mounts = result.get('mounts') or []
-    if not isinstance(mounts, list):
-        raise ValueError('"mounts" must be an array')
-    result['mounts'] = mounts
-    if isinstance(result.get('rootfs'), str) and 'CHROOT_DISTRO_PATH' not in env:
-        rootfs_parent = os.path.dirname(os.path.expanduser(result['rootfs'].rstrip('/')))
+    # Copy so defaults below never leak into the cached config entry
+    env = dict(result.get('environment') or {})
+    rootfs = result.get('rootfs')
+    if isinstance(rootfs, str) and 'CHROOT_DISTRO_PATH' not in env:
+        rootfs_parent = os.path.dirname(os.path.expanduser(rootfs.rstrip('/')))
         if rootfs_parent:
-            env.setdefault('CHROOT_DISTRO_PATH', rootfs_parent)
+            env['CHROOT_DISTRO_PATH'] = rootfs_parent
+
+    result['id'] = container_id
+    result['type'] = container_type
+    result['environment'] = env
+    result['mounts'] = mounts
     if 'auto_start' in result:
         result['auto_start'] = bool(result['auto_start'])
     return result
 
 
-def _ensure_unique_id(containers: List[Dict], container_id: str, *, skip_index: int | None = None) -> None:
-    for idx, item in enumerate(containers):
-        if skip_index is not None and idx == skip_index:
-            continue
-        if item.get('id') == container_id:
-            raise ValueError('Container ID already exists')
+def _ensure_unique_id(snapshot: ConfigSnapshot, container_id: str, *, skip_index: int | None = None) -> None:
+    idx = snapshot.index.get(container_id)
+    if idx is not None and idx != skip_index:
+        raise ValueError('Container ID already exists')
+
+
+# list_sessions.sh costs a bash startup plus a ps per session; the UI tends
+# to list and then attach within moments, so reuse a very recent result.
+SESSIONS_CACHE_TTL_SECONDS = 1.0
+_SESSIONS_CACHE: Tuple[float, List[Dict]] | None = None
 
 
 def _list_sessions():
+    global _SESSIONS_CACHE
+    cached = _SESSIONS_CACHE
+    if cached is not None and time.monotonic() - cached[0] < SESSIONS_CACHE_TTL_SECONDS:
+        return cached[1]
     output, error = _run_script('list_sessions.sh')
     if error:
         raise RuntimeError(error)
     try:
-        return json.loads(output)
+        sessions = _loads(output)
     except json.JSONDecodeError as exc:
         raise RuntimeError(f'Failed to parse sessions: {exc}')
+    _SESSIONS_CACHE = (time.monotonic(), sessions)
+    return sessions
+
+
+SESSIONS_DIR = Path(os.path.expanduser('~/.cache/te'))
+
+
+def _read_session_meta(sid: str) -> Dict[str, str] | None:
+    """Parse a session's KEY="value" meta file (written by scripts/init.sh)."""
+    if not sid or sid in ('.', '..') or os.sep in sid:
+        return None
+    try:
+        text = (SESSIONS_DIR / sid / 'meta').read_text(encoding='utf-8', errors='replace')
+    except OSError:
+        return None
+    meta: Dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition('=')
+        if sep:
+            meta[key.strip()] = value.strip().strip('"').strip("'")
+    return meta
+
+
+@functools.lru_cache(maxsize=1)
+def _dtach_binary() -> str | None:
+    return shutil.which('dtach')
 
 
 def _run_in_session(sid: str, command: str):
-    return _run_script('run_in_session.sh', [sid, command])
+    """Type ``command`` into session ``sid`` through its dtach socket.
+
+    Does what scripts/run_in_session.sh does without the bash hop.
+    Returns ``(stdout, error)`` like :func:`_run_script`.
+    """
+    global _SESSIONS_CACHE
+    # Whatever runs in the session may change what it reports
+    _SESSIONS_CACHE = None
+    meta = _read_session_meta(sid)
+    if meta is None:
+        return None, f'Session {sid} not found.'
+    sock = meta.get('SOCK')
+    if not sock:
+        return None, f'Session {sid} is not attached via dtach.'
+    dtach = _dtach_binary()
+    if not dtach:
+        return None, 'dtach is not installed.'
+    try:
+        result = subprocess.run(
+            [dtach, '-p', sock],
+            input=(command + '\n').encode('utf-8'),
+            capture_output=True,
+            check=False,
+        )
+    except Exception as exc:
+        return None, str(exc)
+    if result.returncode != 0:
+        return None, _decode_output(result.stderr) or f'dtach exited with status {result.returncode}'
+    return _decode_output(result.stdout), None
 
 
 # ---------------------------------------------------------------------------
 # Routes
 
-def _serialize_container(container: Dict, *, shell_by_id=None, shell_by_label=None, sessions=None) -> Dict:
+def _container_static(container: Dict, snapshot: ConfigSnapshot | None) -> Dict:
+    # Any snapshot will do: static_fields() only memoises containers it holds
+    snapshot = snapshot or _SNAPSHOT
+    if snapshot is None:
+        return _compute_static_fields(container)
+    return snapshot.static_fields(container)
+
+
+def _serialize_container(
+    container: Dict,
+    *,
+    snapshot: ConfigSnapshot | None = None,
+    plugin=None,
+    state: Dict | None = None,
+    describe_cache: Dict[str, Dict] | None = None,
+    shell_by_id=None,
+    shell_by_label=None,
+    sessions=None,
+    mountpoints: frozenset | None = None,
+) -> Dict:
     container_id = container.get("id")
     try:
-        plugin = get_plugin(container)
+        if plugin is None:
+            plugin = get_plugin(container)
     except Exception as exc:
-        payload = {
-            'id': container_id,
-            'label': container.get('label') or container_id,
-            'type': container.get('type'),
-            'rootfs': _expand_path(container.get('rootfs')),
-            'state': 'error',
-            'error': str(exc),
-        }
-        return payload
-    saved = _get_state_entry(container_id)
+        return {**_container_static(container, snapshot), 'state': 'error', 'error': str(exc)}
+    if state is None:
+        state = _state_for_request()
+    if describe_cache is None:
+        describe_cache = {}
+    saved = state.get("containers", {}).get(container_id, {})
     shell_id = saved.get("shell_id") if isinstance(saved, dict) else None
-    shell_record = _get_shell_record(shell_id) if shell_id else None
-    shell_info = None
+    shell_record = shell_info = None
+    pair = shell_by_id.get(shell_id) if shell_id and shell_by_id else None
+    if pair:
+        shell_record, shell_info = pair
+    elif shell_id:
+        shell_record, shell_info = _shell_snapshot(shell_id, describe_cache)
     detected = False
     # Gather any currently attached sessions discovered from the Sessions & Shortcuts extension
     sessions = sessions or {}
     discovered_sessions = sessions.get(container_id) or []
     discovered_sids = [s.get('sid') for s in discovered_sessions if s.get('sid')]
-    if shell_record and shell_by_id:
-        pair = shell_by_id.get(shell_record.id)
-        if pair:
-            shell_record, shell_info = pair
     if not shell_record and shell_by_label:
         pair = shell_by_label.get(f'distro:{container_id}')
         if pair:
@@ -278,15 +793,7 @@ def _serialize_container(container: Dict, *, shell_by_id=None, shell_by_label=No
             shell_id = shell_record.id
             detected = True
             _update_container_state(container_id, {'shell_id': shell_id, 'attachments': saved.get('attachments', []) if isinstance(saved, dict) else []})
-    if shell_info is None and shell_record:
-        shell_info = framework_shells.describe(shell_record)
-    shell_running = False
-    if shell_info:
-        stats = shell_info.get('stats') or {}
-        if stats.get('alive'):
-            shell_running = True
-        elif shell_info.get('status') == 'running':
-            shell_running = True
+    shell_running = _shell_alive(shell_info) or bool(shell_info and shell_info.get('status') == 'running')
     if shell_running:
         # Normal path: framework shell is alive → running
         state = 'running'
@@ -303,16 +810,9 @@ def _serialize_container(container: Dict, *, shell_by_id=None, shell_by_label=No
         state = 'mounted'
     else:
         # Fall back to plugin-based mounted/offline detection
-        state = _determine_state(plugin, shell_id)
+        state = _determine_state(plugin, shell_record, shell_info, mountpoints)
 
-    payload = {
-        "id": container_id,
-        "label": container.get("label") or container_id,
-        "type": container.get("type"),
-        "rootfs": _expand_path(container.get("rootfs"))
-    }
-    payload["state"] = state
-    payload["shell_id"] = shell_id
+    payload = {**_container_static(container, snapshot), "state": state, "shell_id": shell_id}
     # Use reconciled attachments if we discovered active sessions; otherwise use saved
     if discovered_sids:
         persisted_attachments = saved.get('attachments', []) if isinstance(saved, dict) else []
@@ -328,62 +828,76 @@ def _serialize_container(container: Dict, *, shell_by_id=None, shell_by_label=No
 def create_container():
     payload = request.get_json(silent=True) or {}
     try:
-        containers = _load_config()
+        snapshot = _config_snapshot()
     except ValueError as exc:
         return _respond_error(str(exc), status=500)
     try:
         container = _normalize_container_payload(payload)
-        _ensure_unique_id(containers, container['id'])
-        get_plugin(container)
+        _ensure_unique_id(snapshot, container['id'])
+        plugin = get_plugin(container)
     except ValueError as exc:
         return _respond_error(str(exc))
     except Exception as exc:
         return _respond_error(str(exc), status=400)
+    # Copy: other requests may be reading the cached list
+    containers = list(snapshot.containers)
     containers.append(container)
     _save_config(containers)
-    return jsonify({'ok': True, 'data': _serialize_container(container)})
+    return _json({'ok': True, 'data': _serialize_container(container, plugin=plugin)})
 
 
 @distro_bp.put('/containers/<container_id>')
 def update_container(container_id: str):
-    container, idx, containers, error = _find_container(container_id)
+    container, idx, snapshot, error = _find_container(container_id)
     if error:
         return error
     payload = request.get_json(silent=True) or {}
     try:
         updated = _normalize_container_payload(payload, existing=container)
-        _ensure_unique_id(containers, updated['id'], skip_index=idx)
-        get_plugin(updated)
+        _ensure_unique_id(snapshot, updated['id'], skip_index=idx)
+        plugin = get_plugin(updated)
     except ValueError as exc:
         return _respond_error(str(exc))
     except Exception as exc:
         return _respond_error(str(exc), status=400)
+    # Copy: other requests may be reading the cached list
+    containers = list(snapshot.containers)
     containers[idx] = updated
     _save_config(containers)
-    return jsonify({'ok': True, 'data': _serialize_container(updated)})
+    return _json({'ok': True, 'data': _serialize_container(updated, plugin=plugin)})
 
 
 @distro_bp.delete('/containers/<container_id>')
 def delete_container(container_id: str):
-    container, idx, containers, error = _find_container(container_id)
+    container, idx, snapshot, error = _find_container(container_id)
     if error:
         return error
+    # Copy: other requests may be reading the cached list
+    containers = list(snapshot.containers)
     containers.pop(idx)
     _save_config(containers)
     _clear_state_entry(container_id)
-    return jsonify({'ok': True, 'data': {'id': container_id}})
+    return _json({'ok': True, 'data': {'id': container_id}})
 
 
 @distro_bp.get("/containers")
 def list_containers():
     try:
-        containers = _load_config()
+        snapshot = _config_snapshot()
     except ValueError as exc:
         return _respond_error(str(exc), status=500)
+    containers = snapshot.containers
     shell_by_id = {}
     shell_by_label = {}
-    for record in framework_shells.list_shells():
-        desc = framework_shells.describe(record)
+    describe_cache: Dict[str, Dict] = {}
+    records = framework_shells.list_shells()
+    # describe() may shell out to ps per live shell; run those concurrently
+    if len(records) > 1:
+        descriptions = list(_EXEC.map(framework_shells.describe, records))
+    else:
+        descriptions = [framework_shells.describe(record) for record in records]
+    for record, desc in zip(records, descriptions):
+        describe_cache[record.id] = desc
         shell_by_id[record.id] = (record, desc)
         label = desc.get('label') or record.label
         if label:
@@ -393,27 +907,41 @@ def list_containers():
         sessions = _list_sessions()
     except Exception:
         sessions = []
+    # Lower-case each container id once rather than per session
+    markers = [(cid, cid.lower()) for cid in (container.get('id') for container in containers) if cid]
     for session in sessions:
+        if not session.get('sid'):
+            continue
         cmdline = (session.get('fg_cmdline') or '').lower()
         comm = (session.get('fg_comm') or '').lower()
-        sid = session.get('sid')
-        if not sid:
+        haystacks = [text for text in (cmdline, comm) if 'chroot-distro' in text]
+        if not haystacks:
             continue
-        for container in containers:
-            cid = container.get('id')
-            if not cid:
-                continue
-            marker = cid.lower()
-            if (('chroot-distro' in cmdline and marker in cmdline) or ('chroot-distro' in comm and marker in comm)):
+        for cid, marker in markers:
+            if any(marker in text for text in haystacks):
                 session_map.setdefault(cid, []).append(session)
                 break
-    data = [_serialize_container(container, shell_by_id=shell_by_id, shell_by_label=shell_by_label, sessions=session_map) for container in containers]
-    return jsonify({"ok": True, "data": data})
+    state = _state_for_request()
+    mountpoints = _request_mountpoints()
+    data = [
+        _serialize_container(
+            container,
+            snapshot=snapshot,
+            state=state,
+            describe_cache=describe_cache,
+            shell_by_id=shell_by_id,
+            shell_by_label=shell_by_label,
+            sessions=session_map,
+            mountpoints=mountpoints,
+        )
+        for container in containers
+    ]
+    return _json({"ok": True, "data": data})
 
 
 @distro_bp.post("/containers/<container_id>/mount")
 def mount_container(container_id: str):
-    container, _idx, _containers, error = _find_container(container_id)
+    container, error = _find_container_readonly(container_id)
     if error:
         return error
     plugin = get_plugin(container)
@@ -421,15 +949,15 @@ def mount_container(container_id: str):
         plugin.mount()
         result = _run_command(plugin.mount_command(), env=plugin.environment())
         if result.returncode != 0:
-            return _respond_error(result.stderr or "Failed to mount container", status=500)
+            return _respond_error(_decode_output(result.stderr) or "Failed to mount container", status=500)
     except Exception as exc:
         return _respond_error(str(exc), status=500)
-    return jsonify({"ok": True, "data": _serialize_container(container)})
+    return _json({"ok": True, "data": _serialize_container(container, plugin=plugin)})
 
 
 @distro_bp.post("/containers/<container_id>/unmount")
 def unmount_container(container_id: str):
-    container, _idx, _containers, error = _find_container(container_id)
+    container, error = _find_container_readonly(container_id)
     if error:
         return error
     plugin = get_plugin(container)
@@ -438,12 +966,12 @@ def unmount_container(container_id: str):
         plugin.unmount()
     except Exception as exc:
         return _respond_error(str(exc), status=500)
-    return jsonify({"ok": True, "data": _serialize_container(container)})
+    return _json({"ok": True, "data": _serialize_container(container, plugin=plugin)})
 
 
 @distro_bp.post("/containers/<container_id>/start")
 def start_container(container_id: str):
-    container, idx, containers, error = _find_container(container_id)
+    container, error = _find_container_readonly(container_id)
     if error:
         return error
     try:
@@ -452,16 +980,10 @@ def start_container(container_id: str):
         return _respond_error(str(exc), status=400)
     saved = _get_state_entry(container_id)
     shell_id = saved.get('shell_id') if isinstance(saved, dict) else None
-    if _shell_is_running(shell_id):
+    _record, description = _shell_snapshot(shell_id)
+    if _shell_alive(description):
         return _respond_error('Container already running', status=409)
-    try:
-        _run_command(plugin.force_unmount_command(), env=plugin.environment())
-    except Exception:
-        pass
-    try:
-        plugin.unmount(force=True)
-    except Exception:
-        pass
+    _force_cleanup(plugin)
     try:
         plugin.mount()
         _run_command(plugin.mount_command(), env=plugin.environment())
@@ -490,12 +1012,12 @@ def start_container(container_id: str):
     except Exception as exc:
         return _respond_error(str(exc), status=500)
     _update_container_state(container_id, {'shell_id': record.id})
-    return jsonify({'ok': True, 'data': _serialize_container(container)})
+    return _json({'ok': True, 'data': _serialize_container(container, plugin=plugin)})
 
 
 @distro_bp.post("/containers/<container_id>/stop")
 def stop_container(container_id: str):
-    container, idx, containers, error = _find_container(container_id)
+    container, error = _find_container_readonly(container_id)
     if error:
         return error
     try:
@@ -510,20 +1032,13 @@ def stop_container(container_id: str):
         framework_shells.terminate_shell(shell_id, force=False)
     except Exception as exc:
         return _respond_error(str(exc), status=500)
-    try:
-        _run_command(plugin.force_unmount_command(), env=plugin.environment())
-    except Exception:
-        pass
-    try:
-        plugin.unmount(force=True)
-    except Exception:
-        pass
+    _force_cleanup(plugin)
     _update_container_state(container_id, {'shell_id': None, 'attachments': []})
-    return jsonify({'ok': True, 'data': _serialize_container(container)})
+    return _json({'ok': True, 'data': _serialize_container(container, plugin=plugin)})
 
 @distro_bp.post("/containers/<container_id>/attach")
 def attach_container(container_id: str):
-    container, idx, containers, error = _find_container(container_id)
+    container, error = _find_container_readonly(container_id)
     if error:
         return error
     payload = request.get_json(silent=True) or {}
@@ -543,23 +1058,22 @@ def attach_container(container_id: str):
         return _respond_error('Session not found', status=404)
     if session.get('busy'):
         return _respond_error('Session is busy', status=409)
-    env_assign = ' '.join(f"{k}={shlex.quote(v)}" for k, v in (plugin.environment() or {}).items() if v)
-    command_parts = plugin.login_command()
-    command_str = ' '.join(shlex.quote(part) for part in command_parts)
-    full_cmd = f"{env_assign} {command_str}".strip()
+    command_str = ' '.join(shell_quote(part) for part in plugin.login_command())
+    full_cmd = f"{plugin.env_assignments()} {command_str}".strip()
     _, error_msg = _run_in_session(sid, full_cmd)
     if error_msg:
         return _respond_error(error_msg, status=500)
     entry = _get_state_entry(container_id)
-    attachments = entry.get('attachments', []) if isinstance(entry, dict) else []
+    attachments = list(entry.get('attachments', [])) if isinstance(entry, dict) else []
     if sid not in attachments:
         attachments.append(sid)
     _update_container_state(container_id, {'attachments': attachments})
+    return _json({'ok': True, 'data': _serialize_container(container, plugin=plugin)})
 
 
 @distro_bp.post("/containers/<container_id>/detach")
 def detach_container(container_id: str):
-    container, idx, containers, error = _find_container(container_id)
+    container, error = _find_container_readonly(container_id)
     if error:
         return error
     payload = request.get_json(silent=True) or {}
@@ -579,12 +1093,12 @@ def detach_container(container_id: str):
     except Exception:
         pass
     _update_container_state(container_id, {'attachments': attachments})
-    return jsonify({'ok': True, 'data': _serialize_container(container)})
+    return _json({'ok': True, 'data': _serialize_container(container, plugin=plugin)})
 
 
 @distro_bp.post("/containers/<container_id>/cleanup")
 def cleanup_container_shells(container_id: str):
-    container, idx, containers, error = _find_container(container_id)
+    container, error = _find_container_readonly(container_id)
     if error:
         return error
     state_entry = _get_state_entry(container_id)
@@ -601,24 +1115,17 @@ def cleanup_container_shells(container_id: str):
             removed.append(record.id)
     except Exception as exc:
         return _respond_error(f'Failed to cleanup shells: {exc}', status=500)
-    return jsonify({'ok': True, 'data': {'removed': removed}})
+    return _json({'ok': True, 'data': {'removed': removed}})
 
 
 @distro_bp.get("/attachments")
 def list_attachments():
-    state = _load_state()
-    mapping = {}
-    for container_id, entry in state.get('containers', {}).items():
-        if not isinstance(entry, dict):
-            continue
-        for sid in entry.get('attachments', []) or []:
-            mapping.setdefault(sid, []).append(container_id)
-    return jsonify({'ok': True, 'data': mapping})
+    return _json({'ok': True, 'data': _attachment_index(_state_for_request())})
 
 
 @distro_bp.post("/containers/<container_id>/command")
 def run_container_command(container_id: str):
-    container, idx, containers, error = _find_container(container_id)
+    container, error = _find_container_readonly(container_id)
     if error:
         return error
     payload = request.get_json(silent=True) or {}
@@ -630,15 +1137,15 @@ def run_container_command(container_id: str):
     ok = result.returncode == 0
     body = {
         "returncode": result.returncode,
-        "stdout": result.stdout,
-        "stderr": result.stderr,
+        "stdout": _decode_output(result.stdout),
+        "stderr": _decode_output(result.stderr),
     }
-    return jsonify({"ok": ok, "data": body})
+    return _json({"ok": ok, "data": body})
 
 
 @distro_bp.get("/containers/<container_id>/logs")
 def get_container_logs(container_id: str):
-    container, idx, containers, error = _find_container(container_id)
+    container, error = _find_container_readonly(container_id)
     if error:
         return error
     tail = request.args.get("tail", default=200, type=int)
@@ -647,24 +1154,38 @@ def get_container_logs(container_id: str):
     record = _get_shell_record(shell_id)
     if not record:
         return _respond_error("No logs available", status=404)
-    description = framework_shells.describe(record, include_logs=True, tail_lines=tail)
-    return jsonify({"ok": True, "data": description.get("logs", {})})
+    try:
+        logs = {
+            "stdout_tail": _tail_file(record.stdout_log, tail),
+            "stderr_tail": _tail_file(record.stderr_log, tail),
+        }
+    except OSError:
+        description = framework_shells.describe(record, include_logs=True, tail_lines=tail)
+        logs = description.get("logs", {})
+    return _json({"ok": True, "data": logs})
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 
 def _find_container(container_id: str):
+    """Return ``(container, idx, snapshot, error_response)`` for ``container_id``."""
     try:
-        containers = _load_config()
+        snapshot = _config_snapshot()
     except ValueError as exc:
         return None, None, None, _respond_error(str(exc), status=500)
-    for idx, container in enumerate(containers):
-        if container.get('id') == container_id:
-            return container, idx, containers, None
-    return None, None, containers, _respond_error('Container not found', status=404)
+    idx = snapshot.index.get(container_id)
+    if idx is not None:
+        return snapshot.containers[idx], idx, snapshot, None
+    return None, None, snapshot, _constant_response(_CONTAINER_NOT_FOUND_BODY, 404)
+
+
+def _find_container_readonly(container_id: str):
+    """Return ``(container, error_response)`` for routes that don't edit the config."""
+    container, _idx, _snapshot, error = _find_container(container_id)
+    return container, error
 
 
 @distro_bp.route("/")
 def status():
-    return jsonify({"ok": True, "data": {"message": "Distro API ready"}})
+    return _constant_response(_STATUS_BODY)
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import os
+import re
+import shlex
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Collection, Dict, List
 
 
 @dataclass
@@ -26,6 +28,16 @@ class MountSpec:
         )
 
 
+# Values made only of these characters need no shell quoting
+_SHELL_SAFE_RE = re.compile(r'[A-Za-z0-9_@%+=:,./-]+')
+
+
+def shell_quote(value: str) -> str:
+    if _SHELL_SAFE_RE.fullmatch(value):
+        return value
+    return shlex.quote(value)
+
+
 class CommandError(RuntimeError):
     def __init__(self, message: str, *, command: List[str]):
         super().__init__(message)
@@ -40,6 +52,10 @@ class ChrootDistroPlugin:
         self.container_id = container.get("id")
         if not self.container_id:
             raise ValueError("Container definition requires an 'id'")
+        # Derived from the definition on first use; a plugin lives for one request
+        self._mount_specs: List[MountSpec] | None = None
+        self._environment: Dict[str, str] | None = None
+        self._env_assignments: str | None = None
 
     # ------------------------------------------------------------------
     # Helpers
@@ -50,48 +66,75 @@ class ChrootDistroPlugin:
         return os.path.abspath(os.path.expanduser(value))
 
     def mount_specs(self) -> List[MountSpec]:
-        mounts = self.container.get("mounts") or []
-        specs = [MountSpec.from_dict(item) for item in mounts]
-        for spec in specs:
-            if not spec.device or not spec.target:
-                raise ValueError(f"Invalid mount spec for {self.container_id}: {spec}")
-        return specs
+        """Parsed mount specs (cached; do not mutate the returned list)."""
+        if self._mount_specs is None:
+            mounts = self.container.get("mounts") or []
+            specs = [MountSpec.from_dict(item) for item in mounts]
+            for spec in specs:
+                if not spec.device or not spec.target:
+                    raise ValueError(f"Invalid mount spec for {self.container_id}: {spec}")
+            self._mount_specs = specs
+        return self._mount_specs
 
     def environment(self) -> Dict[str, str]:
-        env = {}
-        for key, value in (self.container.get("environment") or {}).items():
-            env[key] = self._expand(value)
-        # Provide convenience path if rootfs defined
-        rootfs = self.container.get("rootfs")
-        if rootfs:
-            env.setdefault("DISTRO_ROOTFS", self._expand(rootfs))
-        return env
+        """Expanded container environment (cached; do not mutate the returned dict)."""
+        if self._environment is None:
+            env = {}
+            for key, value in (self.container.get("environment") or {}).items():
+                env[key] = self._expand(value)
+            # Provide convenience path if rootfs defined
+            rootfs = self.container.get("rootfs")
+            if rootfs:
+                env.setdefault("DISTRO_ROOTFS", self._expand(rootfs))
+            self._environment = env
+        return self._environment
+
+    def env_assignments(self) -> str:
+        """``KEY=value ...`` shell prefix for the non-empty environment entries."""
+        if self._env_assignments is None:
+            self._env_assignments = ' '.join(
+                f"{key}={shell_quote(value)}" for key, value in self.environment().items() if value
+            )
+        return self._env_assignments
 
     # ------------------------------------------------------------------
     # Mount management
 
+    # All specs go through a single sudo invocation per operation, so sudo's
+    # start-up cost is paid once rather than per mount.
+
     def mount(self) -> None:
+        mounts: List[List[str]] = []
         for spec in self.mount_specs():
             target = Path(self._expand(spec.target))
             target.mkdir(parents=True, exist_ok=True)
-            cmd: List[str] = ["sudo", "mount"]
+            cmd: List[str] = ["mount"]
             if spec.filesystem:
                 cmd.extend(["-t", spec.filesystem])
             if spec.options:
                 cmd.extend(["-o", spec.options])
             cmd.extend([spec.device, str(target)])
-            self._run(cmd)
+            mounts.append(cmd)
+        if not mounts:
+            return
+        if len(mounts) == 1:
+            self._run(["sudo"] + mounts[0])
+            return
+        # Stop at the first failing mount, as the one-by-one loop did
+        script = " && ".join(shlex.join(cmd) for cmd in mounts)
+        self._run(["sudo", "sh", "-c", script])
 
     def unmount(self, *, force: bool = False) -> None:
-        for spec in reversed(self.mount_specs()):
-            target = self._expand(spec.target)
-            if not target:
-                continue
-            cmd = ["sudo", "umount"]
-            if force:
-                cmd.append("-l")
-            cmd.append(target)
-            self._run(cmd, check=False)
+        targets = [self._expand(spec.target) for spec in reversed(self.mount_specs())]
+        targets = [target for target in targets if target]
+        if not targets:
+            return
+        # umount takes several targets and carries on past failures
+        cmd = ["sudo", "umount"]
+        if force:
+            cmd.append("-l")
+        cmd.extend(targets)
+        self._run(cmd, check=False)
 
     # ------------------------------------------------------------------
     # chroot-distro commands
@@ -119,10 +162,28 @@ class ChrootDistroPlugin:
         except subprocess.CalledProcessError as exc:
             raise CommandError(f"Command failed: {' '.join(command)}", command=command) from exc
 
-    # Utility to evaluate mount state
-    def is_mounted(self) -> bool:
+    def mount_targets(self) -> List[str]:
+        """Expanded mount points for this container's mount specs."""
+        targets = []
         for spec in self.mount_specs():
             target = self._expand(spec.target)
-            if target and not os.path.ismount(target):
+            if target:
+                targets.append(target)
+        return targets
+
+    # Utility to evaluate mount state
+    def is_mounted(self, mountpoints: Collection[str] | None = None) -> bool:
+        """True when every mount target is mounted.
+
+        ``mountpoints`` is an optional set of active mount points (e.g. read
+        once from /proc/self/mounts) to test against instead of probing each
+        target with ``os.path.ismount``.
+        """
+        for target in self.mount_targets():
+            if mountpoints is not None:
+                mounted = target in mountpoints
+            else:
+                mounted = os.path.ismount(target)
+            if not mounted:
                 return False
         return True
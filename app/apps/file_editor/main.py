@@ -1,12 +1,77 @@
+import hashlib
+import json
 import os
-from flask import Blueprint, jsonify, request
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from json.encoder import encode_basestring_ascii
+from flask import Blueprint, Response, jsonify, request, send_file, stream_with_context
 
 file_editor_bp = Blueprint('file_editor', __name__)
 
+READ_CHUNK_CHARS = 64 * 1024
+READ_MANY_MAX_PATHS = 64
+
+# Small pool for /read_many so several files are read concurrently
+_READ_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='file-editor-read')
+
+# realpath -> ((st_mtime_ns, st_size), blake2b digest) as of our last write,
+# so saving identical content over an untouched file can be skipped.
+_WRITE_DIGESTS = {}
+
+# Read once at import: os.umask() can only be queried by setting it, which is
+# not safe to do while other threads may be creating files.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _atomic_write(path, data):
+    """Replace ``path`` with ``data`` via a fsynced temp file and rename.
+
+    Symlinks are written through to their target and an existing file keeps
+    its permissions. Returns False when the write was skipped because the
+    file already holds exactly ``data`` from a previous write.
+    """
+    target = os.path.realpath(path)
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    try:
+        st = os.stat(target)
+    except FileNotFoundError:
+        st = None
+    if st is not None and _WRITE_DIGESTS.get(target) == ((st.st_mtime_ns, st.st_size), digest):
+        return False
+    directory = os.path.dirname(target)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(target) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+            fh.flush()
+            if st is not None:
+                os.fchmod(fh.fileno(), stat.S_IMODE(st.st_mode))
+            else:
+                os.fchmod(fh.fileno(), 0o666 & ~_UMASK)
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, target)
+    except BaseException:
+        _WRITE_DIGESTS.pop(target, None)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    st = os.stat(target)
+    _WRITE_DIGESTS[target] = ((st.st_mtime_ns, st.st_size), digest)
+    return True
+
+# HOME is fixed for the server's lifetime
+_BASE_HOME = os.path.abspath(os.path.expanduser('~'))
+_BASE_HOME_PREFIX = _BASE_HOME.rstrip(os.sep) + os.sep
+
+
 def _expand_and_validate_path(path):
-    base_home = os.path.expanduser('~')
-    expanded = os.path.normpath(os.path.expanduser(path))
-    if not os.path.abspath(expanded).startswith(base_home):
+    # abspath also normalises
+    expanded = os.path.abspath(os.path.expanduser(path))
+    if expanded != _BASE_HOME and not expanded.startswith(_BASE_HOME_PREFIX):
         return None, 'Access denied'
     return expanded, None
 
@@ -24,12 +89,38 @@ def read_file():
         return jsonify({"ok": False, "error": err}), 403
     if not os.path.isfile(expanded):
         return jsonify({"ok": False, "error": 'File not found'}), 404
+    if request.args.get('raw', '0').lower() in {'1', 'true', 'yes', 'on'}:
+        # Plain bytes with ETag/Last-Modified, so unchanged reloads get a 304
+        # and the body can go out through the server's file wrapper.
+        return send_file(expanded, mimetype='text/plain', conditional=True, etag=True)
     try:
-        with open(expanded, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-        return jsonify({"ok": True, "data": {"path": expanded, "content": content}})
+        f = open(expanded, 'r', encoding='utf-8', errors='replace')
+    except Exception as e:
+        return jsonify({"ok": False, "error": str(e)}), 500
+    # Read the first chunk up front so an early read error is still a clean 500
+    try:
+        first = f.read(READ_CHUNK_CHARS)
     except Exception as e:
+        f.close()
         return jsonify({"ok": False, "error": str(e)}), 500
+    if len(first) < READ_CHUNK_CHARS:
+        f.close()
+        return jsonify({"ok": True, "data": {"path": expanded, "content": first}})
+
+    def generate():
+        # Emit the JSON envelope by hand so the file is never held in memory
+        # as a whole; each chunk is escaped as it is read. Once the status
+        # line is sent a later read error can only cut the body short, so
+        # clients treat a truncated (unparseable) response as a failed read.
+        with f:
+            yield '{"ok":true,"data":{"path":%s,"content":"' % json.dumps(expanded)
+            chunk = first
+            while chunk:
+                yield encode_basestring_ascii(chunk)[1:-1]
+                chunk = f.read(READ_CHUNK_CHARS)
+            yield '"}}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 @file_editor_bp.post('/write')
 def write_file():
@@ -44,8 +135,34 @@ def write_file():
     try:
         # Ensure directory exists
         os.makedirs(os.path.dirname(expanded), exist_ok=True)
-        with open(expanded, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _atomic_write(expanded, content.encode('utf-8'))
         return jsonify({"ok": True, "data": {"path": expanded}})
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
+
+
+def _read_one(path):
+    if not isinstance(path, str) or not path:
+        return {"path": path, "error": 'Invalid path'}
+    expanded, err = _expand_and_validate_path(path)
+    if err:
+        return {"path": path, "error": err}
+    if not os.path.isfile(expanded):
+        return {"path": expanded, "error": 'File not found'}
+    try:
+        with open(expanded, 'r', encoding='utf-8', errors='replace') as f:
+            return {"path": expanded, "content": f.read()}
+    except Exception as e:
+        return {"path": expanded, "error": str(e)}
+
+
+@file_editor_bp.post('/read_many')
+def read_many():
+    data = request.get_json(silent=True) or {}
+    paths = data.get('paths')
+    if not isinstance(paths, list) or not paths:
+        return jsonify({"ok": False, "error": '"paths" must be a non-empty array'}), 400
+    if len(paths) > READ_MANY_MAX_PATHS:
+        return jsonify({"ok": False, "error": f'At most {READ_MANY_MAX_PATHS} paths per request'}), 400
+    files = list(_READ_POOL.map(_read_one, paths))
+    return jsonify({"ok": True, "data": {"files": files}})
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import ctypes
+import errno
 import grp
 import json
 import os
 import pwd
+import select
 import shutil
 import stat
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 
 from app.jobs import JobCancelled, register_job_handler
 
@@ -18,6 +25,21 @@ file_explorer_bp = Blueprint("file_explorer_app", __name__)
 
 HOME_DIR = Path(os.path.expanduser("~"))
 
+SUDO_WORKER_IDLE_SECONDS = 60.0
+SUDO_WORKER_REPLY_SECONDS = 60.0
+LIST_STREAM_BATCH = 512
+CHMOD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+COPY_WORKERS = 8
+COPY_RANGE_CHUNK = 256 * 1024 * 1024
+
+_AT_FDCWD = -100
+_RENAME_NOREPLACE = 1
+
+_HAVE_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+_COPY_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+_SCANDIR_FD = os.scandir in os.supports_fd and hasattr(os, 'O_DIRECTORY')
+
 
 def _json_ok(data: Any, status: int = 200):
     return jsonify({"ok": True, "data": data}), status
@@ -27,49 +49,68 @@ def _json_err(message: str, status: int = 400):
     return jsonify({"ok": False, "error": str(message)}), status
 
 
-def _scandir_entries(path: Path, show_hidden: bool) -> List[Dict[str, Any]]:
+def _resolve_uid(uid: int) -> str:
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except (KeyError, AttributeError):
+        return str(uid)
+
+
+def _resolve_gid(gid: int) -> str:
+    try:
+        return grp.getgrgid(gid).gr_name
+    except (KeyError, AttributeError):
+        return str(gid)
+
+
+def _scandir_entries(
+    path: Path,
+    show_hidden: bool,
+    minimal: bool = False,
+    detailed: bool = False,
+) -> List[Dict[str, Any]]:
     entries: List[Dict[str, Any]] = []
-    with os.scandir(path) as iterator:
-        for entry in iterator:
-            name = entry.name
-            if not show_hidden and name.startswith('.'):
-                continue
-            try:
-                if entry.is_dir(follow_symlinks=False):
-                    entry_type = 'directory'
-                elif entry.is_symlink():
-                    entry_type = 'symlink'
-                else:
-                    entry_type = 'file'
-            except PermissionError:
-                entry_type = 'unknown'
-            size = None
-            mtime = None
-            mode = None
-            uid = None
-            gid = None
-            owner = None
-            group = None
-            try:
-                stat_info = entry.stat(follow_symlinks=False)
-                size = stat_info.st_size
-                mtime = int(stat_info.st_mtime)
-                mode = stat_info.st_mode
-                uid = stat_info.st_uid
-                gid = stat_info.st_gid
-                # Try to get owner and group names
-                try:
-                    owner = pwd.getpwuid(uid).pw_name
-                except (KeyError, AttributeError):
-                    owner = str(uid)
+    # Most entries in a directory share a handful of owners; resolve each id once.
+    uid_cache: Dict[int, str] = {}
+    gid_cache: Dict[int, str] = {}
+    # Scanning through a directory fd makes DirEntry.stat() an fstatat()
+    # relative to that fd instead of re-walking the full path per entry.
+    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY) if _SCANDIR_FD else None
+    try:
+        with os.scandir(path if dir_fd is None else dir_fd) as iterator:
+            for entry in iterator:
+                name = entry.name
+                if not show_hidden and name.startswith('.'):
+                    continue
                 try:
-                    group = grp.getgrgid(gid).gr_name
-                except (KeyError, AttributeError):
-                    group = str(gid)
-            except Exception:
-                pass
-            entries.append(
-                {
+                    if entry.is_dir(follow_symlinks=False):
+                        entry_type = 'directory'
+                    elif entry.is_symlink():
+                        entry_type = 'symlink'
+                    else:
+                        entry_type = 'file'
+                except PermissionError:
+                    entry_type = 'unknown'
+                size = None
+                mtime = None
+                mode = None
+                uid = None
+                gid = None
+                owner = None
+                group = None
+                if not minimal:
+                    try:
+                        stat_info = entry.stat(follow_symlinks=False)
+                        size = stat_info.st_size
+                        mtime = int(stat_info.st_mtime)
+                        mode = stat_info.st_mode
+                        uid = stat_info.st_uid
+                        gid = stat_info.st_gid
+                        owner = uid_cache.get(uid) or uid_cache.setdefault(uid, _resolve_uid(uid))
+                        group = gid_cache.get(gid) or gid_cache.setdefault(gid, _resolve_gid(gid))
+                    except Exception:
+                        pass
+                item = {
                     'name': name,
                     'type': entry_type,
                     'path': os.path.join(str(path), name),
@@ -79,91 +120,233 @@ def _scandir_entries(path: Path, show_hidden: bool) -> List[Dict[str, Any]]:
                     'owner': owner,
                     'group': group,
                 }
-            )
+                if detailed and mode is not None:
+                    item.update(_mode_details(mode))
+                entries.append(item)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
     return entries
 
 
-def _scandir_with_sudo(path: Path, show_hidden: bool) -> List[Dict[str, Any]]:
-    script = (
-        "import json, os, sys, pwd, grp\n"
-        f"path = {json.dumps(str(path))}\n"
-        f"show_hidden = {repr(bool(show_hidden))}\n"
-        "entries = []\n"
-        "try:\n"
-        "    with os.scandir(path) as iterator:\n"
-        "        for entry in iterator:\n"
-        "            name = entry.name\n"
-        "            if not show_hidden and name.startswith('.'):\n"
-        "                continue\n"
-        "            try:\n"
-        "                if entry.is_dir(follow_symlinks=False):\n"
-        "                    entry_type = 'directory'\n"
-        "                elif entry.is_symlink():\n"
-        "                    entry_type = 'symlink'\n"
-        "                else:\n"
-        "                    entry_type = 'file'\n"
-        "            except PermissionError:\n"
-        "                entry_type = 'unknown'\n"
-        "            size = None\n"
-        "            mtime = None\n"
-        "            mode = None\n"
-        "            owner = None\n"
-        "            group = None\n"
-        "            try:\n"
-        "                stat_info = entry.stat(follow_symlinks=False)\n"
-        "                size = stat_info.st_size\n"
-        "                mtime = int(stat_info.st_mtime)\n"
-        "                mode = stat_info.st_mode\n"
-        "                uid = stat_info.st_uid\n"
-        "                gid = stat_info.st_gid\n"
-        "                try:\n"
-        "                    owner = pwd.getpwuid(uid).pw_name\n"
-        "                except:\n"
-        "                    owner = str(uid)\n"
-        "                try:\n"
-        "                    group = grp.getgrgid(gid).gr_name\n"
-        "                except:\n"
-        "                    group = str(gid)\n"
-        "            except Exception:\n"
-        "                pass\n"
-        "            entries.append({\n"
-        "                'name': name,\n"
-        "                'type': entry_type,\n"
-        "                'path': os.path.join(path, name),\n"
-        "                'size': size,\n"
-        "                'mtime': mtime,\n"
-        "                'mode': mode,\n"
-        "                'owner': owner,\n"
-        "                'group': group\n"
-        "            })\n"
-        "    json.dump(entries, sys.stdout)\n"
-        "except FileNotFoundError:\n"
-        "    sys.stderr.write('Directory not found')\n"
-        "    sys.exit(44)\n"
-        "except PermissionError as exc:\n"
-        "    sys.stderr.write(str(exc) or 'Permission denied')\n"
-        "    sys.exit(13)\n"
-        "except Exception as exc:\n"
-        "    sys.stderr.write(str(exc))\n"
-        "    sys.exit(99)\n"
-    )
-    result = subprocess.run(
-        ['sudo', '-n', 'python3', '-c', script],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 44:
+# Privileged listings go through one long-lived ``sudo python3`` worker rather
+# than a fresh interpreter per directory. It answers newline-delimited JSON
+# requests and exits on its own once it has been idle for the timeout.
+_SUDO_WORKER_SCRIPT = (
+    "import grp, json, os, pwd, select, sys\n"
+    "idle_timeout = float(sys.argv[1])\n"
+    "def resolve_uid(uid):\n"
+    "    try:\n"
+    "        return pwd.getpwuid(uid).pw_name\n"
+    "    except Exception:\n"
+    "        return str(uid)\n"
+    "def resolve_gid(gid):\n"
+    "    try:\n"
+    "        return grp.getgrgid(gid).gr_name\n"
+    "    except Exception:\n"
+    "        return str(gid)\n"
+    "def scandir(path, show_hidden, minimal):\n"
+    "    entries = []\n"
+    "    uid_cache = {}\n"
+    "    gid_cache = {}\n"
+    "    with os.scandir(path) as iterator:\n"
+    "        for entry in iterator:\n"
+    "            name = entry.name\n"
+    "            if not show_hidden and name.startswith('.'):\n"
+    "                continue\n"
+    "            try:\n"
+    "                if entry.is_dir(follow_symlinks=False):\n"
+    "                    entry_type = 'directory'\n"
+    "                elif entry.is_symlink():\n"
+    "                    entry_type = 'symlink'\n"
+    "                else:\n"
+    "                    entry_type = 'file'\n"
+    "            except PermissionError:\n"
+    "                entry_type = 'unknown'\n"
+    "            size = None\n"
+    "            mtime = None\n"
+    "            mode = None\n"
+    "            owner = None\n"
+    "            group = None\n"
+    "            if not minimal:\n"
+    "                try:\n"
+    "                    stat_info = entry.stat(follow_symlinks=False)\n"
+    "                    size = stat_info.st_size\n"
+    "                    mtime = int(stat_info.st_mtime)\n"
+    "                    mode = stat_info.st_mode\n"
+    "                    uid = stat_info.st_uid\n"
+    "                    gid = stat_info.st_gid\n"
+    "                    owner = uid_cache.get(uid) or uid_cache.setdefault(uid, resolve_uid(uid))\n"
+    "                    group = gid_cache.get(gid) or gid_cache.setdefault(gid, resolve_gid(gid))\n"
+    "                except Exception:\n"
+    "                    pass\n"
+    "            entries.append({\n"
+    "                'name': name,\n"
+    "                'type': entry_type,\n"
+    "                'path': os.path.join(path, name),\n"
+    "                'size': size,\n"
+    "                'mtime': mtime,\n"
+    "                'mode': mode,\n"
+    "                'owner': owner,\n"
+    "                'group': group\n"
+    "            })\n"
+    "    return entries\n"
+    "def handle(message):\n"
+    "    op = message.get('op')\n"
+    "    if op == 'scandir':\n"
+    "        return scandir(message['path'], bool(message.get('show_hidden')), bool(message.get('minimal')))\n"
+    "    raise ValueError('Unknown operation: %s' % op)\n"
+    "while True:\n"
+    "    ready, _, _ = select.select([sys.stdin], [], [], idle_timeout)\n"
+    "    if not ready:\n"
+    "        break\n"
+    "    line = sys.stdin.readline()\n"
+    "    if not line:\n"
+    "        break\n"
+    "    try:\n"
+    "        reply = {'ok': True, 'data': handle(json.loads(line))}\n"
+    "    except FileNotFoundError:\n"
+    "        reply = {'ok': False, 'code': 44, 'error': 'Directory not found'}\n"
+    "    except PermissionError as exc:\n"
+    "        reply = {'ok': False, 'code': 13, 'error': str(exc) or 'Permission denied'}\n"
+    "    except Exception as exc:\n"
+    "        reply = {'ok': False, 'code': 99, 'error': str(exc)}\n"
+    "    sys.stdout.write(json.dumps(reply) + '\\n')\n"
+    "    sys.stdout.flush()\n"
+)
+
+
+_SUDO_UNPACK_SCRIPT = (
+    "import shutil, sys\n"
+    "shutil.unpack_archive(sys.argv[1], sys.argv[2])\n"
+)
+
+
+class _SudoWorker:
+    """Lazily started ``sudo python3`` process serving privileged requests."""
+
+    def __init__(self, idle_timeout: float, reply_timeout: float) -> None:
+        self._idle_timeout = idle_timeout
+        self._reply_timeout = reply_timeout
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+        self._stderr = None
+
+    def _start(self) -> subprocess.Popen:
+        # stderr is only read after the worker dies, so park it in a file
+        # rather than a pipe nobody drains.
+        self._stderr = tempfile.TemporaryFile()
+        try:
+            return subprocess.Popen(
+                ['sudo', '-n', 'python3', '-c', _SUDO_WORKER_SCRIPT, str(self._idle_timeout)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=self._stderr,
+                bufsize=0,
+            )
+        except Exception:
+            self._stderr.close()
+            self._stderr = None
+            raise
+
+    def _discard(self) -> str:
+        proc, self._proc = self._proc, None
+        err, self._stderr = self._stderr, None
+        if proc is not None:
+            try:
+                proc.kill()
+            except OSError:
+                pass
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+            for pipe in (proc.stdin, proc.stdout):
+                try:
+                    pipe.close()
+                except OSError:
+                    pass
+        if err is None:
+            return ''
+        with err:
+            err.seek(0)
+            return err.read().decode('utf-8', 'replace').strip()
+
+    def _readline(self) -> str:
+        """Read one reply line, giving up after the reply timeout."""
+        fd = self._proc.stdout.fileno()
+        deadline = time.monotonic() + self._reply_timeout
+        buffer = b''
+        while not buffer.endswith(b'\n'):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                self._discard()
+                raise RuntimeError('Privileged helper did not respond in time')
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return ''
+            buffer += chunk
+        return buffer.decode('utf-8')
+
+    def _exchange(self, line: str) -> str:
+        if self._proc is None or self._proc.poll() is not None:
+            self._discard()
+            self._proc = self._start()
+        try:
+            view = memoryview(line.encode('utf-8'))
+            while view:
+                view = view[self._proc.stdin.write(view):]
+        except (BrokenPipeError, OSError):
+            return ''
+        return self._readline()
+
+    def request(self, op: str, **params: Any) -> Dict[str, Any]:
+        line = json.dumps({'op': op, **params}) + '\n'
+        with self._lock:
+            reply = self._exchange(line)
+            if not reply:
+                # The worker may have just hit its idle timeout; retry once
+                # with a fresh process before treating it as a failure.
+                self._discard()
+                reply = self._exchange(line)
+            if not reply:
+                message = self._discard()
+                raise RuntimeError(message or 'Privileged helper exited unexpectedly')
+        try:
+            return json.loads(reply)
+        except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+            raise RuntimeError(f'Failed to parse sudo output: {exc}') from exc
+
+
+_SUDO_WORKER = _SudoWorker(SUDO_WORKER_IDLE_SECONDS, SUDO_WORKER_REPLY_SECONDS)
+
+
+def _scandir_with_sudo(path: Path, show_hidden: bool, minimal: bool = False) -> List[Dict[str, Any]]:
+    reply = _SUDO_WORKER.request('scandir', path=str(path), show_hidden=show_hidden, minimal=minimal)
+    if reply.get('ok'):
+        return reply.get('data') or []
+    code = reply.get('code')
+    if code == 44:
         raise FileNotFoundError('Directory not found')
-    if result.returncode == 13:
-        message = result.stderr.strip() or 'Permission denied'
-        raise PermissionError(message)
-    if result.returncode != 0:
-        message = result.stderr.strip() or result.stdout.strip() or 'Failed to list directory'
-        raise RuntimeError(message)
-    try:
-        return json.loads(result.stdout or '[]')
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive
-        raise RuntimeError(f'Failed to parse sudo output: {exc}') from exc
+    if code == 13:
+        raise PermissionError(reply.get('error') or 'Permission denied')
+    raise RuntimeError(reply.get('error') or 'Failed to list directory')
+
+
+def _listing_sort_key(item: Dict[str, Any]) -> Tuple[bool, bytes]:
+    """Directories first, then case-insensitive name order.
+
+    ASCII names take the bytes.lower() fast path; others are lowered as str and
+    encoded to UTF-8, whose byte order matches code point order, so the result
+    is the same ordering as comparing ``name.lower()`` directly.
+    """
+
+    name = item.get('name') or ''
+    if name.isascii():
+        folded = name.encode('ascii').lower()
+    else:
+        folded = name.lower().encode('utf-8', 'surrogatepass')
+    return item.get('type') != 'directory', folded
 
 
 def _run_sudo(argv: List[str]) -> None:
@@ -173,6 +356,40 @@ def _run_sudo(argv: List[str]) -> None:
         raise PermissionError(message)
 
 
+def _load_renameat2():
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.renameat2
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    func.restype = ctypes.c_int
+    return func
+
+
+_RENAMEAT2 = _load_renameat2()
+
+
+def _rename_noreplace(source: str, destination: str) -> None:
+    """Rename without clobbering, letting the kernel report EEXIST.
+
+    Uses renameat2(RENAME_NOREPLACE) so the existence check and the rename are
+    one atomic syscall. Where libc or the filesystem lacks it, falls back to
+    checking first and renaming.
+    """
+
+    if _RENAMEAT2 is not None:
+        result = _RENAMEAT2(_AT_FDCWD, os.fsencode(source), _AT_FDCWD, os.fsencode(destination), _RENAME_NOREPLACE)
+        if result == 0:
+            return
+        err = ctypes.get_errno()
+        if err not in {errno.ENOSYS, errno.EINVAL}:
+            raise OSError(err, os.strerror(err), source, None, destination)
+    if os.path.lexists(destination):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), destination)
+    os.replace(source, destination)
+
+
 def _mode_to_permissions(mode: int) -> Dict[str, Dict[str, bool]]:
     value = stat.S_IMODE(mode)
     def has(flag: int) -> bool:
@@ -197,48 +414,230 @@ def _mode_to_permissions(mode: int) -> Dict[str, Dict[str, bool]]:
     }
 
 
+def _mode_details(mode: int) -> Dict[str, Any]:
+    mode_value = stat.S_IMODE(mode)
+    return {
+        'mode_octal': format(mode_value, '03o'),
+        'mode_int': mode_value,
+        'permissions': _mode_to_permissions(mode_value),
+    }
+
+
+def _entry_to_properties(stat_result: os.stat_result, abs_path: str) -> Dict[str, Any]:
+    # Everything here derives from the lstat() result passed in; only a
+    # symlink costs a second stat(), so is_directory follows it as before.
+    is_dir = stat.S_ISDIR(stat_result.st_mode)
+    is_link = stat.S_ISLNK(stat_result.st_mode)
+    is_file = stat.S_ISREG(stat_result.st_mode)
+    if is_link:
+        try:
+            is_dir = stat.S_ISDIR(os.stat(abs_path).st_mode)
+        except OSError:
+            pass
+
+    try:
+        owner_name = pwd.getpwuid(stat_result.st_uid).pw_name
+    except KeyError:
+        owner_name = stat_result.st_uid
+
+    try:
+        group_name = grp.getgrgid(stat_result.st_gid).gr_name
+    except KeyError:
+        group_name = stat_result.st_gid
+
+    info: Dict[str, Any] = {
+        'path': abs_path,
+        'name': os.path.basename(abs_path) or abs_path,
+        'type': 'directory' if is_dir else 'symlink' if is_link else 'file' if is_file else 'unknown',
+        'is_directory': is_dir,
+        'is_symlink': is_link,
+        'size': stat_result.st_size,
+        'mtime': int(stat_result.st_mtime),
+        **_mode_details(stat_result.st_mode),
+        'owner': owner_name,
+        'group': group_name,
+    }
+    return info
+
+
 def _chmod_recursive_local(target: str, mode_value: int) -> None:
     if os.path.islink(target):
         os.chmod(target, mode_value)
         return
-    for root, dirs, files in os.walk(target):
-        for name in dirs:
-            path = os.path.join(root, name)
-            if os.path.islink(path):
-                continue
-            os.chmod(path, mode_value)
-        for name in files:
-            path = os.path.join(root, name)
-            if os.path.islink(path):
+    # chmod is a pure metadata syscall that releases the GIL, so fan the calls
+    # out over a pool. Files are submitted while walking; directories are held
+    # back until the walk is done so a restrictive mode cannot stop us from
+    # descending into them, and the target itself is changed last.
+    directories: List[str] = []
+    futures = []
+    with ThreadPoolExecutor(max_workers=CHMOD_WORKERS) as pool:
+        pending = [target]
+        while pending:
+            current = pending.pop()
+            try:
+                iterator = os.scandir(current)
+            except OSError:
                 continue
-            os.chmod(path, mode_value)
+            with iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        directories.append(entry.path)
+                        pending.append(entry.path)
+                    else:
+                        futures.append(pool.submit(os.chmod, entry.path, mode_value))
+        futures.extend(pool.submit(os.chmod, path, mode_value) for path in directories)
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is not None:
+                for other in futures:
+                    other.cancel()
+                raise error
     os.chmod(target, mode_value)
 
 
-@file_explorer_bp.route('/list', methods=['GET'])
-def list_directory():
+def _copy_file_fast(source: str, destination: str) -> None:
+    """Copy file contents in-kernel, then carry over metadata like copy2."""
+
+    try:
+        same = os.path.samefile(source, destination)
+    except OSError:
+        same = False
+    if same:
+        # Opening the destination would truncate the source first
+        raise shutil.SameFileError(f'{source!r} and {destination!r} are the same file')
+    with open(source, 'rb') as reader, open(destination, 'wb') as writer:
+        in_fd = reader.fileno()
+        out_fd = writer.fileno()
+        finished = False
+        if _HAVE_COPY_FILE_RANGE:
+            try:
+                copied = 0
+                while True:
+                    sent = os.copy_file_range(in_fd, out_fd, COPY_RANGE_CHUNK)
+                    if not sent:
+                        break
+                    copied += sent
+                finished = copied > 0
+            except OSError as exc:
+                if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+        if not finished:
+            # copy_file_range is unavailable or gave up part way (old kernel,
+            # cross-device, pseudo files that report nothing); both fd offsets
+            # sit just past whatever it copied, so sendfile, then a plain copy,
+            # carry on from there.
+            try:
+                while os.sendfile(out_fd, in_fd, None, COPY_RANGE_CHUNK):
+                    pass
+            except OSError as exc:
+                if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+                reader.seek(os.lseek(in_fd, 0, os.SEEK_CUR))
+                writer.seek(os.lseek(out_fd, 0, os.SEEK_CUR))
+                shutil.copyfileobj(reader, writer, COPY_CHUNK_SIZE)
+    shutil.copystat(source, destination)
+
+
+def _fast_copytree(source: str, destination: str) -> None:
+    """Recreate ``source`` at ``destination`` with file copies spread over a pool.
+
+    Directories are created while walking; their metadata is applied after all
+    files have landed so copying does not disturb the copied mtimes. Symlinks
+    are followed as ``shutil.copytree`` does by default: the target's contents
+    are copied and a dangling link is an error.
+    """
+
+    os.mkdir(destination)
+    directories: List[Tuple[str, str]] = [(source, destination)]
+    futures = []
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        pending = [(source, destination)]
+        while pending:
+            src_dir, dst_dir = pending.pop()
+            with os.scandir(src_dir) as iterator:
+                for entry in iterator:
+                    target = os.path.join(dst_dir, entry.name)
+                    if entry.is_dir():
+                        os.mkdir(target)
+                        directories.append((entry.path, target))
+                        pending.append((entry.path, target))
+                    elif entry.is_file():
+                        futures.append(pool.submit(_copy_file_fast, entry.path, target))
+                    elif not os.path.exists(entry.path):
+                        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), entry.path)
+                    else:
+                        # FIFOs, sockets and device nodes: opening a pipe
+                        # would block a worker forever, so refuse like copy2
+                        raise shutil.SpecialFileError(f'`{entry.path}` is not a regular file')
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is not None:
+                for other in futures:
+                    other.cancel()
+                raise error
+    for src_dir, dst_dir in reversed(directories):
+        try:
+            shutil.copystat(src_dir, dst_dir)
+        except OSError:
+            pass
+
+
+def _list_response(detailed: bool):
     raw_path = request.args.get('path') or str(HOME_DIR)
     show_hidden = request.args.get('hidden', '0').lower() in {'1', 'true', 'yes', 'on'}
+    # minimal=1 returns only name/type/path so navigation skips the per-entry stat.
+    minimal = not detailed and request.args.get('minimal', '0').lower() in {'1', 'true', 'yes', 'on'}
     abs_path = Path(os.path.abspath(os.path.expanduser(raw_path)))
     try:
-        entries = _scandir_entries(abs_path, show_hidden)
+        entries = _scandir_entries(abs_path, show_hidden, minimal, detailed)
     except PermissionError:
         try:
-            entries = _scandir_with_sudo(abs_path, show_hidden)
+            entries = _scandir_with_sudo(abs_path, show_hidden, minimal)
         except FileNotFoundError:
             return _json_err('Directory not found', 404)
         except PermissionError as exc:
             return _json_err(str(exc) or 'Permission denied', 403)
         except Exception as exc:
             return _json_err(str(exc), 500)
+        if detailed:
+            for item in entries:
+                if item.get('mode') is not None:
+                    item.update(_mode_details(item['mode']))
     except FileNotFoundError:
         return _json_err('Directory not found', 404)
     except NotADirectoryError:
         return _json_err('Not a directory', 400)
     except Exception as exc:
         return _json_err(str(exc), 500)
-    entries.sort(key=lambda item: (item.get('type') != 'directory', (item.get('name') or '').lower()))
-    return _json_ok(entries)
+    entries.sort(key=_listing_sort_key)
+
+    # Encode in batches rather than building one JSON string for the whole
+    # directory alongside the entry list.
+    def generate():
+        yield '{"ok":true,"data":['
+        for start in range(0, len(entries), LIST_STREAM_BATCH):
+            batch = ','.join(json.dumps(entry) for entry in entries[start:start + LIST_STREAM_BATCH])
+            yield batch if start == 0 else ',' + batch
+        yield ']}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+@file_explorer_bp.route('/list', methods=['GET'])
+def list_directory():
+    return _list_response(detailed=False)
+
+
+@file_explorer_bp.route('/list_detailed', methods=['GET'])
+def list_directory_detailed():
+    """Listing that also carries the permission fields /properties reports."""
+    return _list_response(detailed=True)
 
 
 @file_explorer_bp.route('/mkdir', methods=['POST'])
@@ -248,13 +647,13 @@ def make_directory():
     name = (data.get('name') or '').strip()
     if not name or '/' in name or name in {'.', '..'}:
         return _json_err('Invalid directory name', 400)
-    if not os.path.isdir(base):
-        return _json_err('Base path is not a directory', 400)
     target = os.path.abspath(os.path.join(base, name))
     try:
-        os.makedirs(target, exist_ok=False)
+        os.mkdir(target)
     except FileExistsError:
         return _json_err('A file or folder with that name already exists', 400)
+    except (FileNotFoundError, NotADirectoryError):
+        return _json_err('Base path is not a directory', 400)
     except PermissionError:
         try:
             _run_sudo(['mkdir', '-p', target])
@@ -299,11 +698,13 @@ def rename_path():
     src_abs = os.path.abspath(os.path.expanduser(source))
     dest_dir = os.path.dirname(src_abs)
     dest_abs = os.path.join(dest_dir, new_name)
-    if os.path.exists(dest_abs):
-        return _json_err('A file or folder with that name already exists', 400)
     try:
-        os.replace(src_abs, dest_abs)
+        _rename_noreplace(src_abs, dest_abs)
+    except FileExistsError:
+        return _json_err('A file or folder with that name already exists', 400)
     except PermissionError:
+        if os.path.lexists(dest_abs):
+            return _json_err('A file or folder with that name already exists', 400)
         try:
             _run_sudo(['mv', src_abs, dest_abs])
         except PermissionError as exc:
@@ -339,7 +740,9 @@ def copy_path():
     
     try:
         if os.path.isdir(src_abs) and not os.path.islink(src_abs):
-            shutil.copytree(src_abs, dest_abs)
+            _fast_copytree(src_abs, dest_abs)
+        elif os.path.isfile(src_abs):
+            _copy_file_fast(src_abs, dest_abs)
         else:
             shutil.copy2(src_abs, dest_abs)
     except PermissionError:
@@ -364,11 +767,13 @@ def move_path():
     if not os.path.isdir(dest_dir_abs):
         return _json_err('Destination is not a directory', 400)
     dest_abs = os.path.join(dest_dir_abs, os.path.basename(src_abs))
-    if os.path.exists(dest_abs):
-        return _json_err('Target already exists at destination', 400)
     try:
-        os.replace(src_abs, dest_abs)
+        _rename_noreplace(src_abs, dest_abs)
+    except FileExistsError:
+        return _json_err('Target already exists at destination', 400)
     except PermissionError:
+        if os.path.lexists(dest_abs):
+            return _json_err('Target already exists at destination', 400)
         try:
             _run_sudo(['mv', src_abs, dest_abs])
         except PermissionError as exc:
@@ -430,9 +835,6 @@ def get_properties():
         return _json_err('Path is required', 400)
 
     abs_path = os.path.abspath(os.path.expanduser(raw_path))
-    if not os.path.exists(abs_path) and not os.path.islink(abs_path):
-        return _json_err('Path not found', 404)
-
     try:
         stat_result = os.lstat(abs_path)
     except FileNotFoundError:
@@ -442,35 +844,7 @@ def get_properties():
     except Exception as exc:
         return _json_err(str(exc), 500)
 
-    mode_value = stat.S_IMODE(stat_result.st_mode)
-    perms = _mode_to_permissions(mode_value)
-
-    try:
-        owner_name = pwd.getpwuid(stat_result.st_uid).pw_name
-    except KeyError:
-        owner_name = stat_result.st_uid
-
-    try:
-        group_name = grp.getgrgid(stat_result.st_gid).gr_name
-    except KeyError:
-        group_name = stat_result.st_gid
-
-    info: Dict[str, Any] = {
-        'path': abs_path,
-        'name': os.path.basename(abs_path) or abs_path,
-        'type': 'directory' if os.path.isdir(abs_path) else 'symlink' if os.path.islink(abs_path) else 'file' if os.path.isfile(abs_path) else 'unknown',
-        'is_directory': os.path.isdir(abs_path),
-        'is_symlink': os.path.islink(abs_path),
-        'size': stat_result.st_size,
-        'mtime': int(stat_result.st_mtime),
-        'mode_octal': format(mode_value, '03o'),
-        'mode_int': mode_value,
-        'permissions': perms,
-        'owner': owner_name,
-        'group': group_name,
-    }
-
-    return _json_ok(info)
+    return _json_ok(_entry_to_properties(stat_result, abs_path))
 
 
 @file_explorer_bp.route('/chmod', methods=['POST'])
@@ -526,14 +900,8 @@ def extract_archive():
     except shutil.ReadError:
         return _json_err('Unsupported or invalid archive format', 400)
     except PermissionError:
-        script = (
-            'import shutil\n'
-            f'source = {json.dumps(source_abs)}\n'
-            f'dest = {json.dumps(dest_abs)}\n'
-            'shutil.unpack_archive(source, dest)\n'
-        )
         try:
-            _run_sudo(['python3', '-c', script])
+            _run_sudo(['python3', '-c', _SUDO_UNPACK_SCRIPT, source_abs, dest_abs])
         except PermissionError as exc:
             return _json_err(str(exc) or 'Permission denied', 403)
         except Exception as exc: